@@ -3,35 +3,42 @@ Complete Language manager for PPTrans with all GUI-required methods
 Final version with correct method signatures
 """
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from googletrans import LANGUAGES
 from utils.logger import LoggerMixin
 
 class LanguageManager(LoggerMixin):
     """Manages language codes and validation for translation"""
     
+    # Popular languages (most commonly used), in display order
+    POPULAR_LANGUAGES: List[str] = [
+        'en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh-cn',
+        'ar', 'hi', 'tr', 'pl', 'nl', 'sv', 'da', 'no', 'fi', 'el',
+        'cs', 'hu', 'ro', 'sk', 'bg', 'hr', 'sl', 'et', 'lv', 'lt'
+    ]
+    # Same codes as a set for membership tests
+    POPULAR_LANGUAGES_SET: FrozenSet[str] = frozenset(POPULAR_LANGUAGES)
+    
+    # Google Translate's language dictionary
+    SUPPORTED_LANGUAGES: Dict[str, str] = dict(LANGUAGES)
+    
+    # Common aliases and variations
+    LANGUAGE_ALIASES: Dict[str, str] = {
+        'zh': 'zh-cn',  # Chinese simplified
+        'zh-hans': 'zh-cn',
+        'zh-hant': 'zh-tw',
+        'pt': 'pt',     # Portuguese
+        'pt-br': 'pt',  # Brazilian Portuguese -> Portuguese
+    }
+    
+    _init_logged = False
+    
     def __init__(self):
-        """Initialize language manager with Google Translate languages"""
-        # Use Google Translate's language dictionary
-        self.languages = LANGUAGES.copy()
-        
-        # Add some common aliases and variations
-        self.language_aliases = {
-            'zh': 'zh-cn',  # Chinese simplified
-            'zh-hans': 'zh-cn',
-            'zh-hant': 'zh-tw',
-            'pt': 'pt',     # Portuguese
-            'pt-br': 'pt',  # Brazilian Portuguese -> Portuguese
-        }
-        
-        # Popular languages (most commonly used)
-        self.popular_languages = [
-            'en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh-cn',
-            'ar', 'hi', 'tr', 'pl', 'nl', 'sv', 'da', 'no', 'fi', 'el',
-            'cs', 'hu', 'ro', 'sk', 'bg', 'hr', 'sl', 'et', 'lv', 'lt'
-        ]
-        
-        self.logger.info(f"Language manager initialized with {len(self.languages)} languages")
+        """Initialize language manager (all language data is class-level, so this is cheap)"""
+        if not LanguageManager._init_logged:
+            LanguageManager._init_logged = True
+            self.logger.info(f"Language manager initialized with {len(self.SUPPORTED_LANGUAGES)} languages")
     
     def is_valid_language_code(self, code: str) -> bool:
         """
@@ -53,17 +60,17 @@ class LanguageManager(LoggerMixin):
             return True
         
         # Check direct match
-        if code in self.languages:
+        if code in self.SUPPORTED_LANGUAGES:
             return True
         
         # Check aliases
-        if code in self.language_aliases:
+        if code in self.LANGUAGE_ALIASES:
             return True
         
         # Check if it's a variant (like 'en-US' for 'en')
         if '-' in code:
             base_code = code.split('-')[0]
-            if base_code in self.languages:
+            if base_code in self.SUPPORTED_LANGUAGES:
                 return True
         
         return False
@@ -88,13 +95,13 @@ class LanguageManager(LoggerMixin):
             return 'auto'
         
         # Check aliases first
-        if code in self.language_aliases:
-            return self.language_aliases[code]
+        if code in self.LANGUAGE_ALIASES:
+            return self.LANGUAGE_ALIASES[code]
         
         # Check if it's a variant
         if '-' in code:
             base_code = code.split('-')[0]
-            if base_code in self.languages:
+            if base_code in self.SUPPORTED_LANGUAGES:
                 return base_code
         
         return code
@@ -106,7 +113,7 @@ class LanguageManager(LoggerMixin):
         Returns:
             Dictionary mapping language codes to language names
         """
-        return self.languages.copy()
+        return self.SUPPORTED_LANGUAGES.copy()
     
     def get_language_name(self, code: str) -> Optional[str]:
         """
@@ -125,7 +132,7 @@ class LanguageManager(LoggerMixin):
             return 'Auto-detect'
         
         code = self.normalize_language_code(code)
-        return self.languages.get(code)
+        return self.SUPPORTED_LANGUAGES.get(code)
     
     def get_common_languages(self) -> Dict[str, str]:
         """
@@ -134,7 +141,7 @@ class LanguageManager(LoggerMixin):
         Returns:
             Dictionary of common language codes and names
         """
-        return {code: self.languages[code] for code in self.popular_languages if code in self.languages}
+        return {code: self.SUPPORTED_LANGUAGES[code] for code in self.POPULAR_LANGUAGES if code in self.SUPPORTED_LANGUAGES}
     
     def get_language_list(self, include_auto_detect: bool = True, popular_first: bool = False) -> List[Tuple[str, str]]:
         """
@@ -156,20 +163,20 @@ class LanguageManager(LoggerMixin):
         
         if popular_first:
             # Get popular languages first
-            popular_langs = [(code, self.languages[code]) 
-                           for code in self.popular_languages 
-                           if code in self.languages]
+            popular_langs = [(code, self.SUPPORTED_LANGUAGES[code]) 
+                           for code in self.POPULAR_LANGUAGES 
+                           if code in self.SUPPORTED_LANGUAGES]
             
             # Get remaining languages sorted by name
-            remaining_codes = [code for code in self.languages.keys() 
-                             if code not in self.popular_languages]
-            remaining_langs = [(code, self.languages[code]) for code in remaining_codes]
+            remaining_codes = [code for code in self.SUPPORTED_LANGUAGES.keys() 
+                             if code not in self.POPULAR_LANGUAGES_SET]
+            remaining_langs = [(code, self.SUPPORTED_LANGUAGES[code]) for code in remaining_codes]
             remaining_langs.sort(key=lambda x: x[1])  # Sort by name
             
             result.extend(popular_langs + remaining_langs)
         else:
             # Return all languages sorted by name
-            all_langs = [(code, name) for code, name in self.languages.items()]
+            all_langs = [(code, name) for code, name in self.SUPPORTED_LANGUAGES.items()]
             all_langs.sort(key=lambda x: x[1])  # Sort by name
             result.extend(all_langs)
         
@@ -192,7 +199,7 @@ class LanguageManager(LoggerMixin):
         matches = {}
         
         # Search by code and name
-        for code, name in self.languages.items():
+        for code, name in self.SUPPORTED_LANGUAGES.items():
             if query in code.lower() or query in name.lower():
                 matches[code] = name
         
@@ -305,7 +312,7 @@ class LanguageManager(LoggerMixin):
         
         # Fallback: search by name
         name_part = display_name.split('(')[0].strip().lower()
-        for code, name in self.languages.items():
+        for code, name in self.SUPPORTED_LANGUAGES.items():
             if name.lower() == name_part:
                 return code
         
@@ -329,3 +336,14 @@ class LanguageManager(LoggerMixin):
             return f"{name.title()} ({code})"
         else:
             return code  # Fallback to just the code
+
+
+@lru_cache(maxsize=None)
+def get_language_manager() -> LanguageManager:
+    """
+    Shared language manager for callers that don't need their own
+    
+    Created on first call rather than at import, so its init log goes through the
+    handlers set up by setup_logger().
+    """
+    return LanguageManager()
@@ -1,27 +1,192 @@
 """
 PPTX Processor with FIXED text distribution - no more text corruption
 """
+import copy
+import io
+import mmap
 import os
+import re
+import struct
+import zipfile
 import html  # Add this import for HTML entity decoding
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Callable
-from pptx import Presentation
-from pptx.enum.text import PP_ALIGN
-from pptx.util import Pt
-from pptx.dml.color import RGBColor
+from types import MappingProxyType
+from xml.etree import ElementTree
+from typing import List, Dict, Any, Optional, Tuple, Callable, Mapping, Sequence
+from lxml import etree
 from utils.logger import LoggerMixin
 from utils.exceptions import ValidationError, PPTXProcessingError
+from utils.translation_cache import TranslationCache
+
+PRESENTATIONML_NS = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+DRAWINGML_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+
+# DrawingML tags and paths read during formatting extraction
+_RUN_PROPERTIES_TAG = f'{{{DRAWINGML_NS}}}rPr'
+_PARAGRAPH_PROPERTIES_TAG = f'{{{DRAWINGML_NS}}}pPr'
+_LATIN_FONT_TAG = f'{{{DRAWINGML_NS}}}latin'
+_SOLID_RGB_COLOR_PATH = f'{{{DRAWINGML_NS}}}solidFill/{{{DRAWINGML_NS}}}srgbClr'
+_SPACE_BEFORE_POINTS_PATH = f'{{{DRAWINGML_NS}}}spcBef/{{{DRAWINGML_NS}}}spcPts'
+_SPACE_AFTER_POINTS_PATH = f'{{{DRAWINGML_NS}}}spcAft/{{{DRAWINGML_NS}}}spcPts'
+_RUN_TAG = f'{{{DRAWINGML_NS}}}r'
+_TEXT_TAG = f'{{{DRAWINGML_NS}}}t'
+_XML_TRUE_VALUES = ('1', 'true')
+_XML_ALIGNMENT_NAMES = MappingProxyType({'l': 'left', 'ctr': 'center', 'r': 'right', 'just': 'justify'})
+
+# Control characters python-pptx escapes when setting run text (tab and newline are allowed)
+_XML_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B-\x1F]')
+
+# A URL anywhere in a text
+_URL_RE = re.compile(r'https?://[^\s]+')
+
+# One comma-separated part of a slide range: "3" or "2-5"
+_SLIDE_RANGE_PART_RE = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+)\s*)?$')
+
+# Compiled once: paragraphs of all top-level text shapes on a slide, and the runs of a paragraph
+_XPATH_NAMESPACES = {'p': PRESENTATIONML_NS, 'a': DRAWINGML_NS}
+_SLIDE_PARAGRAPHS_XPATH = etree.XPath('./p:cSld/p:spTree/p:sp/p:txBody/a:p', namespaces=_XPATH_NAMESPACES)
+_PARAGRAPH_RUNS_XPATH = etree.XPath('./a:r', namespaces=_XPATH_NAMESPACES)
+
+
+# python-pptx imports its whole part/oxml tree on first import, so it is only imported
+# where it is used; this keeps it out of application startup until a deck is opened
+
+# Length and color values are immutable, and decks reuse a handful of sizes and colors
+@lru_cache(maxsize=256)
+def _points(value: float):
+    """Cached Pt length for a point size"""
+    from pptx.util import Pt
+    return Pt(value)
+
+
+@lru_cache(maxsize=4096)
+def _rgb_color(r: int, g: int, b: int):
+    """Cached RGBColor for a color triple"""
+    from pptx.dml.color import RGBColor
+    return RGBColor(r, g, b)
+
+
+@lru_cache(maxsize=None)
+def _alignment_values() -> Mapping[str, Any]:
+    """Alignment names used in extracted formatting, mapped back to python-pptx values"""
+    from pptx.enum.text import PP_ALIGN
+    return MappingProxyType({
+        'left': PP_ALIGN.LEFT,
+        'center': PP_ALIGN.CENTER,
+        'right': PP_ALIGN.RIGHT,
+        'justify': PP_ALIGN.JUSTIFY
+    })
+
+@lru_cache(maxsize=128)
+def _parse_slide_range(slide_range: str, total_slides: int) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """
+    Parse an explicit slide range specification (cached, the result only depends on the arguments)
+    
+    Args:
+        slide_range: Range specification like '3' or '1-3,5'
+        total_slides: Number of slides in the presentation
+        
+    Returns:
+        Tuple of (sorted 0-based slide indices, error messages for invalid parts)
+    """
+    # Slide numbers are small dense ints, so a flag per slide dedups and keeps them in order
+    selected = bytearray(total_slides)
+    invalid_parts = []
+    
+    for part in slide_range.split(','):
+        if not part.strip():
+            continue
+        
+        match = _SLIDE_RANGE_PART_RE.match(part)
+        if match is None:
+            if '-' in part:
+                invalid_parts.append(f"Invalid range format: {part.strip()}")
+            else:
+                invalid_parts.append(f"Invalid slide number: {part.strip()}")
+            continue
+        
+        start_str, end_str = match.groups()
+        if end_str is None:
+            slide_num = int(start_str) - 1  # Convert to 0-based
+            if 0 <= slide_num < total_slides:
+                selected[slide_num] = 1
+            continue
+        
+        if not total_slides:
+            continue  # Nothing to clamp a range to
+        
+        # Convert to 0-based and clamp the range to the presentation
+        start = max(0, min(int(start_str) - 1, total_slides - 1))
+        end = max(0, min(int(end_str) - 1, total_slides - 1))
+        if start > end:
+            start, end = end, start
+        selected[start:end + 1] = b'\x01' * (end + 1 - start)
+    
+    return tuple(i for i, flag in enumerate(selected) if flag), tuple(invalid_parts)
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map usable as a zip file object (mmap only gains seekable() in Python 3.13)"""
+    
+    def seekable(self) -> bool:
+        return True
+
+
+def _copy_zip_entry_raw(source_zip: zipfile.ZipFile, target_zip: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """
+    Copy a zip entry with its already-compressed bytes, skipping inflate and deflate
+    
+    Args:
+        source_zip: Archive to copy from
+        target_zip: Archive opened for writing
+        info: Entry of source_zip to copy
+    """
+    # The entry data follows its local header, whose name/extra lengths can differ from the central directory
+    source_fp = source_zip.fp
+    source_fp.seek(info.header_offset)
+    header = source_fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    source_fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+    data = source_fp.read(info.compress_size)
+    
+    target_info = copy.copy(info)
+    target_info.flag_bits &= ~0x08  # CRC and sizes are known, so they go in the local header
+    target_fp = target_zip.fp
+    target_info.header_offset = target_fp.tell()
+    target_fp.write(target_info.FileHeader())
+    target_fp.write(data)
+    target_zip.filelist.append(target_info)
+    target_zip.NameToInfo[target_info.filename] = target_info
+    target_zip.start_dir = target_fp.tell()
 
 
 class PPTXProcessor(LoggerMixin):
     """PowerPoint processor optimized for batch translation with FIXED text distribution"""
     
-    def __init__(self, advanced_settings: dict):
-        """Initialize with advanced settings from config"""
+    # Symbol fonts (lowercase) replaced with Calibri when translations are applied
+    PROBLEMATIC_FONTS = ('zapf dingbats', 'symbol', 'wingdings', 'webdings')
+    
+    def __init__(self, advanced_settings: dict, translator=None):
+        """
+        Initialize with advanced settings from config
+        
+        Args:
+            advanced_settings: Advanced settings section from config
+            translator: Optional PPTransTranslator to reuse; created on first use otherwise
+        """
         self.settings = advanced_settings
+        self._translator = translator
+        self._translation_cache = None  # Opened on first translation
         self.presentation = None
         self.current_file = None
+        self._slide_cache = {}  # Slide objects resolved so far, keyed by 0-based index
+        self._source_package = None  # Original package bytes (or mapping/path) for incremental saves
+        self._modified_slides = set()  # 0-based indices of slides changed by apply_translations
         self.text_elements = []
+        self._formatting_pool = {}  # Shared formatting dicts keyed by their contents
         self.processing_stats = {
             'total_slides': 0,
             'processed_slides': 0,
@@ -38,209 +203,318 @@ class PPTXProcessor(LoggerMixin):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"PowerPoint file not found: {file_path}")
             
+        from pptx import Presentation
+        
         try:
             self.current_file = file_path
-            self.presentation = Presentation(file_path)
+            
+            # Slurp the package into memory so the zip reader does not issue many
+            # small seeks/reads against the file; huge decks are memory-mapped instead,
+            # so the zip reader works straight off the page cache
+            self._release_source_package()
+            if os.path.getsize(file_path) < self.settings.get('max_in_memory_bytes', 512 << 20):
+                with open(file_path, 'rb') as f:
+                    self._source_package = f.read()
+                self.presentation = Presentation(io.BytesIO(self._source_package))
+            else:
+                self._source_package = self._map_file(file_path)
+                self.presentation = Presentation(self._source_package)
+            self._slide_cache = {}
+            self._modified_slides = set()
             self.processing_stats['total_slides'] = len(self.presentation.slides)
             self.logger.info(f"Loaded presentation with {self.processing_stats['total_slides']} slides")
         except Exception as e:
             self.logger.error(f"Failed to load presentation: {e}")
+            self._release_source_package()
             raise PPTXProcessingError(f"Cannot load PowerPoint file: {e}", file_path=file_path)
     
+    def _map_file(self, file_path: str):
+        """Memory-map a file read-only, falling back to the path if it cannot be mapped"""
+        try:
+            with open(file_path, 'rb') as f:
+                mapping = _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self.logger.debug("Could not memory-map %s, reading from disk: %s", file_path, e)
+            return file_path
+        
+        # Zip members are mostly read front to back
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapping.madvise(mmap.MADV_SEQUENTIAL)
+        return mapping
+    
+    def _release_source_package(self) -> None:
+        """Drop the original package kept for incremental saves, unmapping it if it was mapped"""
+        if isinstance(self._source_package, _MappedFile):
+            self._source_package.close()
+        self._source_package = None
+    
+    def peek_presentation_info(self, file_path: str) -> Dict[str, Any]:
+        """
+        Get presentation information without building the python-pptx object tree
+        
+        Only ppt/presentation.xml is read from the package to count the slides, which is
+        enough for file info displays. Falls back to a full load if the fast parser is
+        disabled or the package layout is unexpected.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"PowerPoint file not found: {file_path}")
+        
+        if self.settings.get('fast_parser', True):
+            try:
+                with zipfile.ZipFile(file_path) as package:
+                    root = ElementTree.fromstring(package.read('ppt/presentation.xml'))
+                slide_ids = root.find(f'{{{PRESENTATIONML_NS}}}sldIdLst')
+                total_slides = 0 if slide_ids is None else len(slide_ids)
+                return {'total_slides': total_slides, 'file_path': file_path}
+            except Exception as e:
+                self.logger.debug("Fast slide count failed, loading full presentation: %s", e)
+        
+        self.load_presentation(file_path)
+        return self.get_presentation_info()
+    
     def get_presentation_info(self) -> Dict[str, Any]:
         """Get presentation information"""
         if not self.presentation:
             return {'total_slides': 0}
         
         return {
-            'total_slides': len(self.presentation.slides),
+            'total_slides': self.processing_stats['total_slides'],
             'file_path': self.current_file
         }
     
-    def parse_slide_range(self, slide_range: str) -> List[int]:
-        """Parse slide range specification into list of slide indices"""
+    def parse_slide_range(self, slide_range: str) -> Sequence[int]:
+        """
+        Parse slide range specification into slide indices
+        
+        Returns:
+            Sorted 0-based slide indices ('all' gives a range over every slide)
+        """
         if not self.presentation:
             raise PPTXProcessingError("No presentation loaded")
         
-        total_slides = len(self.presentation.slides)
-        
-        if slide_range.lower() == 'all':
-            return list(range(total_slides))
+        total_slides = self.processing_stats['total_slides']
+        if slide_range.strip().lower() == 'all':
+            return range(total_slides)
         
-        indices = []
-        parts = slide_range.split(',')
+        indices, invalid_parts = _parse_slide_range(slide_range, total_slides)
+        for message in invalid_parts:
+            self.logger.error(message)
         
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            
-            if '-' in part:
-                try:
-                    start_str, end_str = part.split('-', 1)
-                    start = int(start_str.strip()) - 1  # Convert to 0-based
-                    end = int(end_str.strip()) - 1      # Convert to 0-based
-                    
-                    # Validate range
-                    start = max(0, min(start, total_slides - 1))
-                    end = max(0, min(end, total_slides - 1))
-                    
-                    if start <= end:
-                        indices.extend(range(start, end + 1))
-                    else:
-                        indices.extend(range(end, start + 1))
-                        
-                except ValueError as e:
-                    self.logger.error(f"Invalid range format: {part}")
-                    continue
-            else:
-                try:
-                    slide_num = int(part) - 1  # Convert to 0-based
-                    if 0 <= slide_num < total_slides:
-                        indices.append(slide_num)
-                except ValueError:
-                    self.logger.error(f"Invalid slide number: {part}")
-                    continue
-        
-        # Remove duplicates and sort
-        indices = sorted(list(set(indices)))
-        self.logger.debug(f"Parsed slide range '{slide_range}' to indices: {indices}")
-        return indices
+        self.logger.debug("Parsed slide range '%s' to indices: %s", slide_range, indices)
+        return list(indices)
     
     def _extract_run_formatting(self, run) -> Dict[str, Any]:
-        """Extract all formatting information from a text run"""
-        formatting = {}
+        """
+        Extract all formatting information from a text run
+        
+        Reads the run's <a:rPr> element directly rather than going through the python-pptx
+        font proxies, which resolve every property with a separate XML lookup.
+        """
+        formatting = {'bold': False, 'italic': False, 'underline': False}
         
         try:
-            if hasattr(run, 'font'):
-                font = run.font
-                
-                # Font name
-                if hasattr(font, 'name') and font.name:
-                    formatting['font_name'] = font.name
-                
-                # Font size
-                if hasattr(font, 'size') and font.size:
-                    formatting['font_size'] = font.size.pt
-                
-                # Bold, italic, underline
-                formatting['bold'] = font.bold if font.bold is not None else False
-                formatting['italic'] = font.italic if font.italic is not None else False
-                formatting['underline'] = font.underline if font.underline is not None else False
-                
-                # Font color
-                try:
-                    if hasattr(font, 'color') and font.color and hasattr(font.color, 'rgb'):
-                        rgb = font.color.rgb
-                        if rgb:
-                            formatting['font_color'] = (rgb.r, rgb.g, rgb.b)
-                except Exception:
-                    pass  # Color extraction can fail
+            rPr = run._r.find(_RUN_PROPERTIES_TAG)
+            if rPr is None:
+                return formatting
+            
+            # Font name
+            latin = rPr.find(_LATIN_FONT_TAG)
+            if latin is not None and latin.get('typeface'):
+                formatting['font_name'] = latin.get('typeface')
+            
+            # Font size (stored in hundredths of a point)
+            size = rPr.get('sz')
+            if size:
+                formatting['font_size'] = int(size) / 100.0
+            
+            # Bold, italic, underline
+            formatting['bold'] = rPr.get('b') in _XML_TRUE_VALUES
+            formatting['italic'] = rPr.get('i') in _XML_TRUE_VALUES
+            underline = rPr.get('u')
+            if underline is not None and underline != 'none':
+                if underline == 'sng':
+                    formatting['underline'] = True
+                else:
+                    from pptx.enum.text import MSO_UNDERLINE
+                    formatting['underline'] = MSO_UNDERLINE.from_xml(underline)
+            
+            # Font color (only explicit RGB colors can be reapplied)
+            color = rPr.find(_SOLID_RGB_COLOR_PATH)
+            if color is not None and color.get('val'):
+                rgb = int(color.get('val'), 16)
+                formatting['font_color'] = ((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF)
                     
         except Exception as e:
-            self.logger.debug(f"Error extracting run formatting: {e}")
+            self.logger.debug("Error extracting run formatting: %s", e)
         
         return formatting
     
     def _extract_paragraph_formatting(self, paragraph) -> Dict[str, Any]:
-        """Extract paragraph-level formatting"""
+        """Extract paragraph-level formatting directly from the paragraph's <a:pPr> element"""
         formatting = {}
         
         try:
+            pPr = paragraph._p.find(_PARAGRAPH_PROPERTIES_TAG)
+            if pPr is None:
+                return formatting
+            
             # Paragraph alignment
-            if hasattr(paragraph, 'alignment') and paragraph.alignment is not None:
-                alignment_map = {
-                    PP_ALIGN.LEFT: 'left',
-                    PP_ALIGN.CENTER: 'center', 
-                    PP_ALIGN.RIGHT: 'right',
-                    PP_ALIGN.JUSTIFY: 'justify'
-                }
-                formatting['alignment'] = alignment_map.get(paragraph.alignment, 'left')
-            
-            # Space before/after
-            if hasattr(paragraph, 'space_before') and paragraph.space_before:
-                formatting['space_before'] = paragraph.space_before.pt
+            alignment = pPr.get('algn')
+            if alignment is not None:
+                formatting['alignment'] = _XML_ALIGNMENT_NAMES.get(alignment, 'left')
+            
+            # Space before/after (stored in hundredths of a point)
+            space_before = pPr.find(_SPACE_BEFORE_POINTS_PATH)
+            if space_before is not None and int(space_before.get('val', 0)):
+                formatting['space_before'] = int(space_before.get('val')) / 100.0
                 
-            if hasattr(paragraph, 'space_after') and paragraph.space_after:
-                formatting['space_after'] = paragraph.space_after.pt
+            space_after = pPr.find(_SPACE_AFTER_POINTS_PATH)
+            if space_after is not None and int(space_after.get('val', 0)):
+                formatting['space_after'] = int(space_after.get('val')) / 100.0
                 
         except Exception as e:
-            self.logger.debug(f"Error extracting paragraph formatting: {e}")
+            self.logger.debug("Error extracting paragraph formatting: %s", e)
         
         return formatting
     
+    def _intern_formatting(self, formatting: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a shared dict for identical run/paragraph formatting so repeated styles are stored once"""
+        try:
+            key = tuple(sorted(formatting.items()))
+        except TypeError:
+            return formatting  # Unhashable values, keep as is
+        # setdefault is atomic, so this stays safe when slides are scanned in parallel
+        return self._formatting_pool.setdefault(key, formatting)
+    
+    def _get_slide(self, slide_idx: int):
+        """Resolve a slide on first use only and reuse it on later extractions"""
+        slide = self._slide_cache.get(slide_idx)
+        if slide is None:
+            slide = self.presentation.slides[slide_idx]
+            self._slide_cache[slide_idx] = slide
+        return slide
+    
+    def _extract_slide_elements(self, slide_idx: int) -> List[Dict[str, Any]]:
+        """Extract paragraph elements from a single slide (element ids are assigned by the caller)"""
+        from pptx.text.text import _Paragraph, _Run
+        
+        slide = self._get_slide(slide_idx)
+        slide_elements = []
+        
+        # Bind hot-loop lookups to locals once per slide
+        append_element = slide_elements.append
+        extract_run_formatting = self._extract_run_formatting
+        extract_paragraph_formatting = self._extract_paragraph_formatting
+        intern_formatting = self._intern_formatting
+        
+        # One XPath pass collects every paragraph of every top-level text shape;
+        # shape objects are only looked up for their index and text frame
+        shapes_by_element = {shape._element: (shape_idx, shape) for shape_idx, shape in enumerate(slide.shapes)}
+        current_sp = None
+        
+        for p in _SLIDE_PARAGRAPHS_XPATH(slide._element):
+            sp = p.getparent().getparent()
+            if sp is not current_sp:
+                current_sp = sp
+                shape_idx, shape = shapes_by_element[sp]
+                text_frame = shape.text_frame
+                para_idx = 0
+            else:
+                para_idx += 1
+            
+            # Paragraphs without runs (spacers, bare line breaks) need no further work
+            if p.find(_RUN_TAG) is None:
+                continue
+            
+            # Collect the run texts in a single pass over the <a:r> children
+            run_texts = [(run_idx, r, r.findtext(_TEXT_TAG) or '') for run_idx, r in enumerate(_PARAGRAPH_RUNS_XPATH(p))]
+            paragraph_text = ''.join(text for _, _, text in run_texts)
+            if not paragraph_text.strip():
+                continue
+            
+            # Group by paragraph for better context in batch translation
+            paragraph = _Paragraph(p, text_frame)
+            paragraph_formatting = intern_formatting(extract_paragraph_formatting(paragraph))
+            
+            # Collect all runs in this paragraph (empty runs carry no text to translate)
+            paragraph_runs = []
+            for run_idx, r, run_text in run_texts:
+                if run_text:
+                    paragraph_runs.append({
+                        'run_index': run_idx,
+                        'text': run_text,
+                        'formatting': intern_formatting(extract_run_formatting(_Run(r, paragraph)))
+                    })
+            
+            # Create a paragraph-level element for batch translation; it is located by its
+            # (slide, shape, paragraph, run) indices rather than by python-pptx proxy objects
+            append_element({
+                'id': None,
+                'slide_index': slide_idx,
+                'shape_index': shape_idx,
+                'paragraph_index': para_idx,
+                'type': 'paragraph',
+                'original_text': paragraph_text,
+                'translated_text': None,
+                'paragraph_formatting': paragraph_formatting,
+                'runs': paragraph_runs
+            })
+        
+        return slide_elements
+    
+    def _resolve_paragraph(self, element: Dict[str, Any]):
+        """Look up the live paragraph object for an extracted element from its indices"""
+        shape = self._get_slide(element['slide_index']).shapes[element['shape_index']]
+        return shape.text_frame.paragraphs[element['paragraph_index']]
+    
+    def _extract_slide_result(self, slide_idx: int) -> Tuple[int, Optional[List[Dict[str, Any]]], Optional[Exception]]:
+        """Extract one slide, capturing errors so a failing slide doesn't abort the others"""
+        try:
+            return slide_idx, self._extract_slide_elements(slide_idx), None
+        except Exception as e:
+            return slide_idx, None, e
+    
     def extract_text_elements(self, slide_range: str = "all") -> List[Dict[str, Any]]:
         """
         Extract text elements from specified slides with smart grouping for batch translation
+        
+        Slides are independent, so with 'parallel_processing' enabled they are scanned
+        on a thread pool; results are still collected in slide order.
         """
         if not self.presentation:
             raise PPTXProcessingError("No presentation loaded")
         
         slide_indices = self.parse_slide_range(slide_range)
         self.text_elements = []
-        element_id = 0
+        self._formatting_pool = {}
         
         self.logger.info(f"Extracting text from slides: {[i+1 for i in slide_indices]}")
         
-        for slide_idx in slide_indices:
-            try:
-                slide = self.presentation.slides[slide_idx]
-                slide_elements = 0
-                
-                for shape_idx, shape in enumerate(slide.shapes):
-                    if hasattr(shape, 'text_frame') and shape.text_frame:
-                        text_frame = shape.text_frame
-                        
-                        # Group by paragraph for better context in batch translation
-                        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-                            if not paragraph.text.strip():
-                                continue
-                                
-                            paragraph_formatting = self._extract_paragraph_formatting(paragraph)
-                            
-                            # Collect all runs in this paragraph
-                            paragraph_runs = []
-                            paragraph_text_parts = []
-                            
-                            for run_idx, run in enumerate(paragraph.runs):
-                                if run.text:  # Include even empty runs to preserve structure
-                                    run_formatting = self._extract_run_formatting(run)
-                                    
-                                    run_data = {
-                                        'run_index': run_idx,
-                                        'text': run.text,
-                                        'formatting': run_formatting,
-                                        'run_ref': run
-                                    }
-                                    paragraph_runs.append(run_data)
-                                    paragraph_text_parts.append(run.text)
-                            
-                            if paragraph_runs:  # Only if we have runs with text
-                                # Create a paragraph-level element for batch translation
-                                element = {
-                                    'id': element_id,
-                                    'slide_index': slide_idx,
-                                    'shape_index': shape_idx,
-                                    'paragraph_index': para_idx,
-                                    'type': 'paragraph',
-                                    'original_text': ''.join(paragraph_text_parts),
-                                    'translated_text': None,
-                                    'paragraph_formatting': paragraph_formatting,
-                                    'runs': paragraph_runs,
-                                    'shape_ref': shape,
-                                    'paragraph_ref': paragraph
-                                }
-                                
-                                self.text_elements.append(element)
-                                element_id += 1
-                                slide_elements += 1
-                
-                self.processing_stats['processed_slides'] += 1
-                self.logger.debug(f"Slide {slide_idx + 1}: Found {slide_elements} paragraph elements")
-                
-            except Exception as e:
-                self.logger.error(f"Error processing slide {slide_idx + 1}: {e}")
+        # 'extract_workers' tunes extraction separately from the general worker count
+        max_workers = (self.settings.get('extract_workers')
+                       or self.settings.get('max_workers', min(8, os.cpu_count() or 1)))
+        max_workers = min(max_workers, len(slide_indices))
+        if self.settings.get('parallel_processing', False) and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                slide_results = list(executor.map(self._extract_slide_result, slide_indices))
+        else:
+            slide_results = [self._extract_slide_result(slide_idx) for slide_idx in slide_indices]
+        
+        # Assign element ids in a single ordered pass
+        element_id = 0
+        for slide_idx, slide_elements, error in slide_results:
+            if error is not None:
+                self.logger.error(f"Error processing slide {slide_idx + 1}: {error}")
                 self.processing_stats['error_count'] += 1
+                continue
+            
+            for element in slide_elements:
+                element['id'] = element_id
+                element_id += 1
+            self.text_elements.extend(slide_elements)
+            
+            self.processing_stats['processed_slides'] += 1
+            self.logger.debug("Slide %d: Found %d paragraph elements", slide_idx + 1, len(slide_elements))
         
         self.processing_stats['text_elements_found'] = len(self.text_elements)
         self.logger.info(f"Extracted {len(self.text_elements)} paragraph elements from {len(slide_indices)} slides")
@@ -249,11 +523,8 @@ class PPTXProcessor(LoggerMixin):
     
     def _should_skip_translation(self, text: str) -> bool:
         """Check if text should be skipped from translation (URLs, emails, etc.)"""
-        import re
-        
         # Skip URLs
-        url_pattern = r'https?://[^\s]+'
-        if re.search(url_pattern, text):
+        if _URL_RE.search(text):
             return True
         
         # Skip if text is mostly a URL
@@ -262,66 +533,132 @@ class PPTXProcessor(LoggerMixin):
             
         return False
     
-    def translate_text_elements(self, translate_callback: Callable[[str], str]) -> None:
+    def _get_translation_cache(self) -> Optional[TranslationCache]:
+        """Get the persistent translation cache, or None if 'cache_translations' is disabled (the default)"""
+        if not self.settings.get('cache_translations', False):
+            return None
+        if self._translation_cache is None:
+            self._translation_cache = TranslationCache(self.settings.get('translation_cache_file'),
+                                                       max_entries=self.settings.get('translation_cache_max_entries', 100_000))
+        return self._translation_cache
+    
+    def close(self) -> None:
+        """Release resources held across runs (the translation cache file and any mapped deck)"""
+        if self._translation_cache is not None:
+            self._translation_cache.close()
+            self._translation_cache = None
+        self._release_source_package()
+    
+    def _get_translator(self):
+        """Get the batch translator, creating it once per processor if none was injected"""
+        if self._translator is None:
+            from core.translator import PPTransTranslator
+            self._translator = PPTransTranslator(self.settings.get('translation', {}))
+        return self._translator
+    
+    def translate_text_elements(self, translate_callback: Optional[Callable[[str], str]] = None,
+                                source_lang: str = 'de', target_lang: str = 'en',
+                                progress_callback: Optional[Callable[[int], None]] = None) -> None:
         """
         Translate extracted text elements using batch processing
         
         Args:
-            translate_callback: Function that handles translation - now expects to handle batches
+            translate_callback: Unused, kept for compatibility - translation goes through the batch translator
+            source_lang: Source language code ('auto' lets the API detect it)
+            target_lang: Target language code
+            progress_callback: Called as batches finish with the number of text elements they covered
         """
         if not self.text_elements:
             raise ValidationError("No text elements to translate")
         
-        # Check if the translator supports batch translation
-        from core.translator import PPTransTranslator
-        translator = PPTransTranslator(self.settings.get('translation', {}))
-        
-        # Collect all text to translate
-        texts_to_translate = []
-        element_map = {}  # Map translation results back to elements
-        
-        for i, element in enumerate(self.text_elements):
+        # Collect the elements that need translation; everything else keeps its original text.
+        # Extraction already drops whitespace-only paragraphs, so the text is not re-stripped here
+        pending_elements = []
+        for element in self.text_elements:
             original_text = element['original_text']
-            if original_text and original_text.strip():
+            if self._should_skip_translation(original_text):
                 # Skip URLs and other content that shouldn't be translated
-                if self._should_skip_translation(original_text):
-                    element['translated_text'] = original_text  # Keep original
-                    self.logger.debug(f"Skipped translation for URL/special content: '{original_text[:50]}...'")
-                    continue
-                    
-                texts_to_translate.append(original_text)
-                element_map[len(texts_to_translate) - 1] = i
+                element['translated_text'] = original_text  # Keep original
+                self.logger.debug("Skipped translation for URL/special content: '%.50s...'", original_text)
             else:
-                element['translated_text'] = original_text  # Keep empty/whitespace as is
+                pending_elements.append(element)
+        
+        # Repeated text (titles, footers, boilerplate) is only sent to the translator once;
+        # the counts tell how many elements each unique text covers for progress reporting
+        occurrences = Counter(element['original_text'] for element in pending_elements)
+        texts_to_translate = list(occurrences)
+        
+        if progress_callback:
+            progress_callback(len(self.text_elements) - len(pending_elements))
         
         if not texts_to_translate:
             self.logger.info("No text found that needs translation")
             return
         
-        self.logger.info(f"Starting batch translation of {len(texts_to_translate)} text elements")
+        # Texts translated in earlier runs come from the persistent cache; entries are tied to
+        # the translator's output fingerprint, so glossary or API changes don't serve stale text
+        cache = self._get_translation_cache()
+        translations = {}
+        fingerprint = ''
+        if cache is not None:
+            fingerprint = self._get_translator().output_fingerprint
+            for text in texts_to_translate:
+                cached = cache.get(text, source_lang, target_lang, fingerprint)
+                if cached is not None:
+                    translations[text] = cached
+        texts_to_send = [text for text in texts_to_translate if text not in translations]
+        
+        if progress_callback and translations:
+            progress_callback(sum(occurrences[text] for text in translations))
+        
+        self.logger.info(f"Starting batch translation of {len(texts_to_send)} unique texts "
+                         f"for {len(pending_elements)} text elements ({len(translations)} cached)")
+        
+        def record_batch(finished: Dict[int, str]) -> None:
+            """Collect one finished API batch, caching it and reporting progress"""
+            for index, translated_text in finished.items():
+                text = texts_to_send[index]
+                translations[text] = translated_text
+                # The translator hands back the original text on failure, so only cache real translations
+                if cache is not None and translated_text and translated_text != text:
+                    cache.set(text, source_lang, target_lang, translated_text, fingerprint)
+            
+            if progress_callback:
+                progress_callback(sum(occurrences[texts_to_send[index]] for index in finished))
         
         try:
-            # Use batch translation
-            translated_texts = translator.translate_text_batch(
-                texts_to_translate, 
-                source_lang='de', 
-                target_lang='en'
-            )
-            
-            # Map results back to elements
+            # All unique texts go to the translator in one call, so it can keep several API
+            # batches in flight; progress is reported as each of them comes back
+            if texts_to_send:
+                api_source_lang = None if source_lang == 'auto' else source_lang
+                translator = self._get_translator()
+                translator.translate_text_batch(texts_to_send, source_lang=api_source_lang,
+                                                target_lang=target_lang, batch_callback=record_batch)
+            
+            if cache is not None and texts_to_send:
+                cache.sync()
+            
+            # Fan the results back out to every element with the same text; with 'stream_apply'
+            # each element is written back to the slide in the same pass instead of in a
+            # second walk by apply_translations
+            stream_apply = self.settings.get('stream_apply', True)
             translated_count = 0
-            for batch_idx, translated_text in enumerate(translated_texts):
-                if batch_idx in element_map:
-                    element_idx = element_map[batch_idx]
-                    element = self.text_elements[element_idx]
-                    
-                    if translated_text and translated_text != element['original_text']:
-                        element['translated_text'] = translated_text
-                        translated_count += 1
-                        self.logger.debug(f"Translated paragraph {element['id']}: '{element['original_text'][:50]}...' -> '{translated_text[:50]}...'")
-                    else:
-                        element['translated_text'] = element['original_text']
+            apply_errors = 0
+            for element in pending_elements:
+                translated_text = translations.get(element['original_text'])
+                if translated_text and translated_text != element['original_text']:
+                    element['translated_text'] = translated_text
+                    translated_count += 1
+                    self.logger.debug("Translated paragraph %s: '%.50s...' -> '%.50s...'",
+                                      element['id'], element['original_text'], translated_text)
+                else:
+                    element['translated_text'] = element['original_text']
+                
+                if stream_apply and not self._apply_element_translation(element):
+                    apply_errors += 1
             
+            if apply_errors:
+                self.processing_stats['error_count'] += apply_errors
             self.processing_stats['translated_elements'] = translated_count
             self.processing_stats['skipped_elements'] = len(self.text_elements) - translated_count
             
@@ -358,11 +695,32 @@ class PPTXProcessor(LoggerMixin):
             for i in range(1, len(runs)):
                 runs[i]['translated_text'] = ''
         
-        self.logger.debug(f"Distributed translation cleanly: '{translated_text[:50]}...'")
+        self.logger.debug("Distributed translation cleanly: '%.50s...'", translated_text)
+    
+    def _set_run_text(self, run, text: str) -> None:
+        """Write run text straight into its <a:t> node, using the python-pptx setter only when escaping is needed"""
+        t = run._r.find(_TEXT_TAG)
+        if t is None or _XML_CONTROL_CHARS_RE.search(text):
+            run.text = text  # python-pptx escapes control characters
+        else:
+            t.text = text
+    
+    def _is_problematic_font(self, font_name: Optional[str]) -> bool:
+        """Check for symbol fonts that should be replaced in translated text"""
+        if not font_name:
+            return False
+        font_name = font_name.lower()
+        return any(prob_font in font_name for prob_font in self.PROBLEMATIC_FONTS)
     
     def _apply_run_formatting(self, run, formatting: Dict[str, Any]) -> None:
         """Apply formatting to a text run with enhanced font handling"""
         try:
+            # Setting run text keeps <a:rPr>, so a run whose properties still match the
+            # extracted formatting needs no writes (unless its font must be replaced)
+            if (formatting == self._extract_run_formatting(run)
+                    and not self._is_problematic_font(formatting.get('font_name'))):
+                return
+            
             if hasattr(run, 'font'):
                 font = run.font
                 
@@ -371,20 +729,19 @@ class PPTXProcessor(LoggerMixin):
                     font_name = formatting['font_name']
                     
                     # Skip problematic symbol fonts
-                    problematic_fonts = ['Zapf Dingbats', 'Symbol', 'Wingdings', 'Webdings']
-                    if any(prob_font.lower() in font_name.lower() for prob_font in problematic_fonts):
+                    if self._is_problematic_font(font_name):
                         # Use a safe default font instead
                         font.name = 'Calibri'
-                        self.logger.debug(f"Replaced problematic font '{font_name}' with Calibri")
+                        self.logger.debug("Replaced problematic font '%s' with Calibri", font_name)
                     else:
                         font.name = font_name
                 
                 # Apply font size
                 if 'font_size' in formatting and formatting['font_size']:
                     try:
-                        font.size = Pt(formatting['font_size'])
+                        font.size = _points(formatting['font_size'])
                     except Exception as size_error:
-                        self.logger.debug(f"Error setting font size: {size_error}")
+                        self.logger.debug("Error setting font size: %s", size_error)
                 
                 # Apply bold, italic, underline
                 if 'bold' in formatting:
@@ -398,78 +755,140 @@ class PPTXProcessor(LoggerMixin):
                 if 'font_color' in formatting and formatting['font_color']:
                     try:
                         r, g, b = formatting['font_color']
-                        font.color.rgb = RGBColor(r, g, b)
+                        font.color.rgb = _rgb_color(r, g, b)
                     except Exception as color_error:
-                        self.logger.debug(f"Error setting font color: {color_error}")
+                        self.logger.debug("Error setting font color: %s", color_error)
                     
         except Exception as e:
-            self.logger.debug(f"Error applying run formatting: {e}")
+            self.logger.debug("Error applying run formatting: %s", e)
     
     def _apply_paragraph_formatting(self, paragraph, formatting: Dict[str, Any]) -> None:
         """Apply formatting to a paragraph"""
         try:
             # Apply alignment
             if 'alignment' in formatting:
-                alignment_map = {
-                    'left': PP_ALIGN.LEFT,
-                    'center': PP_ALIGN.CENTER,
-                    'right': PP_ALIGN.RIGHT,
-                    'justify': PP_ALIGN.JUSTIFY
-                }
-                if formatting['alignment'] in alignment_map:
-                    paragraph.alignment = alignment_map[formatting['alignment']]
+                alignment = _alignment_values().get(formatting['alignment'])
+                if alignment is not None:
+                    paragraph.alignment = alignment
             
             # Apply spacing
             if 'space_before' in formatting:
-                paragraph.space_before = Pt(formatting['space_before'])
+                paragraph.space_before = _points(formatting['space_before'])
             if 'space_after' in formatting:
-                paragraph.space_after = Pt(formatting['space_after'])
+                paragraph.space_after = _points(formatting['space_after'])
                 
         except Exception as e:
-            self.logger.debug(f"Error applying paragraph formatting: {e}")
+            self.logger.debug("Error applying paragraph formatting: %s", e)
     
-    def apply_translations(self) -> None:
-        """Apply translated text to the presentation with preserved formatting"""
-        if not self.text_elements:
-            raise ValidationError("No text elements to apply")
-        
-        self.logger.info("Applying FIXED batch translations to presentation")
-        
-        applied_count = 0
-        error_count = 0
+    def _apply_element_translation(self, element: Dict[str, Any]) -> bool:
+        """
+        Write one element's translation back to its paragraph
         
-        for element in self.text_elements:
-            try:
-                if element['translated_text'] is None:
-                    continue
+        Returns:
+            True if the element was applied (or needed no change), False on error
+        """
+        try:
+            # Untranslated paragraphs keep their runs exactly as they are
+            if element['translated_text'] != element['original_text']:
+                self._modified_slides.add(element['slide_index'])
                 
                 # Use the FIXED distribution method
                 self._distribute_translation_to_runs(element)
                 
+                paragraph = self._resolve_paragraph(element)
+                runs = paragraph.runs
+                
                 # Apply translated text to each run
                 for run_data in element['runs']:
-                    run = run_data['run_ref']
                     translated_text = run_data.get('translated_text', run_data['text'])
+                    if translated_text == run_data['text']:
+                        continue  # Nothing to write back for this run
                     
                     # Apply the translated text
-                    run.text = translated_text
+                    run = runs[run_data['run_index']]
+                    self._set_run_text(run, translated_text)
                     
                     # Reapply formatting
                     self._apply_run_formatting(run, run_data['formatting'])
                 
                 # Apply paragraph formatting
-                self._apply_paragraph_formatting(element['paragraph_ref'], element['paragraph_formatting'])
+                self._apply_paragraph_formatting(paragraph, element['paragraph_formatting'])
                 
+                self.logger.debug("Applied CLEAN translation to paragraph %s", element['id'])
+            
+            element['applied'] = True
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error applying translation to element {element.get('id', 'unknown')}: {e}")
+            return False
+    
+    def apply_translations(self) -> None:
+        """
+        Apply translated text to the presentation with preserved formatting
+        
+        Elements already written back while translating ('stream_apply') are skipped,
+        so in that mode this only handles elements that were never sent for translation.
+        """
+        if not self.text_elements:
+            raise ValidationError("No text elements to apply")
+        
+        self.logger.info("Applying FIXED batch translations to presentation")
+        
+        applied_count = 0
+        error_count = 0
+        
+        for element in self.text_elements:
+            if element['translated_text'] is None or element.get('applied'):
+                continue
+            
+            if self._apply_element_translation(element):
                 applied_count += 1
-                self.logger.debug(f"Applied CLEAN translation to paragraph {element['id']}")
-                
-            except Exception as e:
-                self.logger.error(f"Error applying translation to element {element.get('id', 'unknown')}: {e}")
+            else:
                 error_count += 1
         
         self.logger.info(f"Applied {applied_count} CLEAN translations, {error_count} errors")
         self.processing_stats['error_count'] += error_count
     
+    def _save_modified_parts(self, buffer: io.BytesIO) -> bool:
+        """
+        Write the package by re-serializing only the slides changed by apply_translations
+        
+        All other zip entries are copied from the original package still compressed, which
+        skips the XML serialization and deflate python-pptx would otherwise do for every
+        part. Returns False (leaving the buffer empty) when this is disabled or fails, so
+        the caller can fall back to Presentation.save.
+        """
+        if not self.settings.get('incremental_save', True) or self._source_package is None:
+            return False
+        
+        try:
+            modified_parts = {}
+            for slide_idx in self._modified_slides:
+                part = self._get_slide(slide_idx).part
+                modified_parts[part.partname.lstrip('/')] = part
+            
+            source = self._source_package
+            if isinstance(source, bytes):
+                source = io.BytesIO(source)
+            
+            # Unchanged entries (media in particular) keep their compressed bytes as they are
+            with zipfile.ZipFile(source) as source_zip, zipfile.ZipFile(buffer, 'w') as target_zip:
+                for info in source_zip.infolist():
+                    part = modified_parts.get(info.filename)
+                    if part is not None:
+                        target_zip.writestr(info, part.blob)
+                    else:
+                        _copy_zip_entry_raw(source_zip, target_zip, info)
+            
+            self.logger.debug("Saved incrementally: %d of the package parts re-serialized", len(modified_parts))
+            return True
+        except Exception as e:
+            self.logger.warning(f"Incremental save failed, saving full presentation: {e}")
+            buffer.seek(0)
+            buffer.truncate()
+            return False
+    
     def save_presentation(self) -> str:
         """Save the modified presentation"""
         if not self.presentation or not self.current_file:
@@ -480,13 +899,26 @@ class PPTXProcessor(LoggerMixin):
             input_path = Path(self.current_file)
             output_path = input_path.parent / f"{input_path.stem}_translated{input_path.suffix}"
             
-            self.presentation.save(str(output_path))
+            # Serialize into memory first so the XML/zip work is not interleaved
+            # with disk writes, then flush the finished package in one write
+            buffer = io.BytesIO()
+            if not self._save_modified_parts(buffer):
+                self.presentation.save(buffer)
+            output_path.write_bytes(buffer.getbuffer())
             self.logger.info(f"Presentation saved to: {output_path}")
+            
+            # python-pptx read every part at load time, so the original package is only
+            # needed for this save; later saves write the full presentation
+            self._release_source_package()
             return str(output_path)
         except Exception as e:
             self.logger.error(f"Failed to save presentation: {e}")
             raise PPTXProcessingError(f"Cannot save presentation: {e}", file_path=str(output_path))
     
-    def get_processing_stats(self) -> Dict[str, Any]:
-        """Get processing statistics"""
+    def get_processing_stats(self) -> Mapping[str, Any]:
+        """Get a read-only live view of the processing statistics (use snapshot_processing_stats to keep a copy)"""
+        return MappingProxyType(self.processing_stats)
+    
+    def snapshot_processing_stats(self) -> Dict[str, Any]:
+        """Get a mutable copy of the processing statistics"""
         return self.processing_stats.copy()
\ No newline at end of file
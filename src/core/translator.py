@@ -2,13 +2,17 @@
 Enhanced Translation Engine using Google Cloud Translation API (Paid Tier)
 Preserves all existing content filtering, academic context, and post-processing
 """
+import hashlib
 import os
+import threading
 import time
 import re
-from typing import Optional, Dict, List, Tuple, Set
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 from pathlib import Path
-from google.cloud import translate_v2 as translate
-from google.oauth2 import service_account
 
 # Handle imports for both test context (from project root) and app context (from src/)
 try:
@@ -19,62 +23,334 @@ except ImportError:
     from utils.exceptions import TranslationError, NetworkError, RateLimitError
 
 
+# Candidate locations for the service account key and the glossary, in priority order
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+CREDENTIALS_PATHS = (
+    _PROJECT_ROOT / "credentials" / "google-translate-key.json",
+    _PROJECT_ROOT / "credentials" / "service-account-key.json",
+    _PROJECT_ROOT / "credentials" / "google-cloud-key.json",
+)
+GLOSSARY_PATHS = (
+    _PROJECT_ROOT / "academic_glossary.txt",
+    _PROJECT_ROOT / "config" / "academic_glossary.txt",
+    _PROJECT_ROOT / "resources" / "academic_glossary.txt",
+)
+
+
+def _first_existing_path(candidates: Tuple[Path, ...]) -> Optional[Path]:
+    """First of the candidate paths that exists (not cached, so files added later are found)"""
+    return next((path for path in candidates if path.exists()), None)
+
+
+# Content that shouldn't be translated (preserved from original), combined into one regex
+SKIP_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',  # Email
+    r'^[\+\d\s\-\(\)☎📧]{6,}$',  # Phone numbers and symbols
+    r'^https?://',  # URLs
+    r'^[^\w\s]{1,3}$',  # Single symbols/punctuation
+    r'^\d+$',  # Numbers only
+    r'^[A-Z][a-z]+ [A-Z][a-z]+$',  # Names (First Last)
+    r'^\s*[\.,;:!\?|►▪•♦<>]+\s*$',  # Punctuation/symbols
+    r'^.{1,2}$',  # Very short content
+)))
+
+# Any word character; text without one is only whitespace or punctuation
+_WORD_CHAR_RE = re.compile(r'\w')
+
+# Enhanced context-specific terms with better German academic vocabulary (preserved from original)
+CONTEXT_TERMS: Mapping[str, str] = MappingProxyType({
+    # University/Academic terms
+    'Erstsemestertag': 'First Semester Orientation Day',
+    'Studierende': 'students',
+    'Studierenden': 'students',  # Different case
+    'Studiengang': 'degree program',
+    'Hochschule Heilbronn': 'Heilbronn University of Applied Sciences',
+    'Heilbronn': 'Heilbronn',
+    'Standort': 'location',  # This was causing the repetition
+    'Standortes': 'location',
+    'des Standortes': 'of the campus',  # Better contextual translation
+    'am Standort': 'at the campus',
+    'für den Standort': 'for the campus',
+    
+    # Student organization terms
+    'Vertritt die Interessen': 'Represents the interests',
+    'Plant Veranstaltungen': 'Plans events',
+    'Seien Sie aktiv': 'Be active',
+    'engagieren Sie sich': 'get involved',
+    
+    # Academic activities
+    'Veranstaltungen': 'events',
+    'Vorlesung': 'lecture',
+    'Seminar': 'seminar',
+    'Übung': 'tutorial',
+    'Prüfung': 'exam',
+    'Semester': 'semester',
+    'Campus': 'campus',
+    
+    # General German terms that are often mistranslated
+    'aller Art': 'of all kinds',
+    'sich engagieren': 'get involved',
+    'aktiv sein': 'be active',
+    
+    # Keep German place names
+    'Deutschland': 'Germany',
+    'Baden-Württemberg': 'Baden-Württemberg',
+    
+    # Names and titles that shouldn't be translated
+    'GDM': 'GDM',
+    'Ani Antonyan': 'Ani Antonyan',
+    'mv-international': 'mv-international',
+    'hs-heilbronn.de': 'hs-heilbronn.de',
+})
+
+
+# Known repetition artifacts in Google's output for "Standort" and their fixes
+REPETITION_FIXES = {
+    'of the location of the location': 'of the campus',
+    'the location of the location': 'the campus',
+    'for the location': 'for the campus',
+    'at the location': 'at the campus',
+    'students of the location': 'students at the campus',
+}
+
+
+def _trie_to_regex(node: dict) -> str:
+    """Regex source for a character trie; longer continuations are tried before stopping at a shorter phrase"""
+    branches = [re.escape(char) + _trie_to_regex(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    return '(?:' + body + ')?' if '' in node else body
+
+
+def _compile_phrase_pattern(phrases) -> Optional[re.Pattern]:
+    """
+    Compile phrases into one case-insensitive pattern that prefers the longest phrase
+    
+    The phrases are merged into a trie first, so at each position the regex engine follows
+    shared prefixes once instead of trying every phrase in turn; scanning cost no longer
+    grows with the number of phrases. Each match is replaced once, so this only suits
+    tables whose entries don't build on each other's output (the glossary, not REPETITION_FIXES).
+    
+    Args:
+        phrases: Lowercase phrases to match
+        
+    Returns:
+        Compiled pattern, or None if there are no phrases
+    """
+    if not phrases:
+        return None
+    
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = {}  # Marks the end of a phrase
+    return re.compile(_trie_to_regex(trie), re.IGNORECASE)
+
+
+# One pattern per fix, applied in table order: later fixes rely on the text left by earlier ones
+# ('for the location of the location' -> 'for the campus'), so they can't be merged into one pass
+_REPETITION_PATTERNS = tuple((bad_phrase, re.compile(re.escape(bad_phrase), re.IGNORECASE), good_phrase)
+                             for bad_phrase, good_phrase in REPETITION_FIXES.items())
+# Every repetition phrase contains this word, so texts without it need no scan
+_REPETITION_TRIGGER = 'location'
+
+
+def _pack_batches(items: List[Tuple[str, List[int]]], max_chars: int, max_items: int):
+    """
+    Group (text, positions) items into API batches, each limited by total characters and item count
+    
+    Args:
+        items: (text, positions) pairs in order
+        max_chars: Character budget per batch (a single longer text still gets its own batch)
+        max_items: Maximum number of texts per batch
+        
+    Yields:
+        Lists of consecutive items
+    """
+    batch = []
+    batch_chars = 0
+    for item in items:
+        text_chars = len(item[0])
+        if batch and (batch_chars + text_chars > max_chars or len(batch) >= max_items):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(item)
+        batch_chars += text_chars
+    if batch:
+        yield batch
+
+
+def _completed_results(function: Callable, items: Iterable, max_workers: int) -> Iterator:
+    """
+    Call function on each item, on up to max_workers threads, yielding results as they finish
+    
+    Results are yielded in completion order in the calling thread; with one worker the
+    calls run one after another without a pool.
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield function(item)
+        return
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(function, item) for item in items]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until enough tokens have refilled"""
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens that can accumulate (the allowed burst)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1) -> None:
+        """Take tokens from the bucket, sleeping until they are available"""
+        tokens = min(tokens, self.capacity)  # Oversized requests wait for a full bucket
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class TranslationServiceV3Client:
+    """
+    Cloud Translation v3 client (gRPC, one long-lived HTTP/2 channel) exposing the
+    translate()/get_languages() interface of the v2 REST client used throughout this module
+    """
+    
+    def __init__(self, credentials=None, project_id: Optional[str] = None):
+        """
+        Args:
+            credentials: Service account credentials (default: application default credentials)
+            project_id: Google Cloud project that is billed for the requests
+        """
+        from google.cloud import translate_v3
+        
+        self._client = translate_v3.TranslationServiceClient(credentials=credentials)
+        self._parent = f"projects/{project_id}/locations/global"
+    
+    def translate(self, values, source_language: Optional[str] = None, target_language: Optional[str] = None):
+        """Translate a string or a list of strings; results are dicts with 'translatedText' like in v2"""
+        single = isinstance(values, str)
+        request = {
+            'parent': self._parent,
+            'contents': [values] if single else list(values),
+            'mime_type': 'text/plain',
+            'target_language_code': target_language,
+        }
+        if source_language:
+            request['source_language_code'] = source_language  # Omitted for auto-detection
+        
+        response = self._client.translate_text(request=request)
+        results = [{'translatedText': translation.translated_text,
+                    'detectedSourceLanguage': translation.detected_language_code}
+                   for translation in response.translations]
+        return results[0] if single else results
+    
+    def get_languages(self) -> List[Dict[str, str]]:
+        """Supported languages as v2-style dicts with 'language' and 'name'"""
+        response = self._client.get_supported_languages(parent=self._parent, display_language_code='en')
+        return [{'language': language.language_code, 'name': language.display_name or language.language_code}
+                for language in response.languages]
+
+
 class PPTransTranslator(LoggerMixin):
     """Enhanced translation service using Google Cloud API with reliable batch processing"""
     
     def __init__(self, translation_settings: dict):
         """Initialize with translation settings from config"""
         self.settings = translation_settings
+        # 'v3' (default) or 'v2'; v3 falls back to v2 when no Google Cloud project can be found
+        self.api_version = 'v2' if translation_settings.get('api_version', 'v3') == 'v2' else 'v3'
         
         # Initialize Google Cloud Translation client
         self.client = self._initialize_google_client()
         
         # Content filtering (preserved from your original)
         self.skip_patterns = self._compile_skip_patterns()
+        # Decks repeat the same short strings (slide numbers, bullets, footers), so decisions are cached
+        self._is_skippable = lru_cache(maxsize=8192)(self._match_skip_rules)
         self.context_terms = self._load_enhanced_context_terms()
         
-        # Load external glossary for academic terms
+        # Load external glossary for academic terms, matched in a single regex pass
         self.glossary_terms = self._load_glossary_from_file()
+        self._glossary_pattern = _compile_phrase_pattern(self.glossary_terms)
+        # Persisted translations are final output, so they are only valid for the same glossary,
+        # post-processing fixes and API version
+        self.output_fingerprint = self._output_fingerprint()
         
         # With paid API, we can safely enable batch processing again!
         self.use_batching = translation_settings.get('use_batching', True)
         self.batch_size = translation_settings.get('batch_size', 50)  # Can handle larger batches now
+        self.max_concurrency = translation_settings.get('max_concurrency', 8)  # Batch requests in flight at once
+        self.max_chars_per_request = translation_settings.get('chunk_size', 5000)  # Keeps requests well below the API limit
+        
+        # Recent final translations by (source, target, text), so repeated strings cost no API call
+        self._translation_memo: OrderedDict = OrderedDict()
+        self._memo_size = translation_settings.get('memo_size', 4096)
+        self._memo_lock = threading.Lock()
         
         # Rate limiting (much more generous with paid API)
         self.request_count = 0
         self.hour_start_time = time.time()
+        self._usage_lock = threading.Lock()  # Batches may be sent from several threads
+        
+        # Throttle before sending instead of running into the API's quotas
+        requests_per_second = translation_settings.get('max_requests_per_second', 100)
+        chars_per_minute = translation_settings.get('max_chars_per_minute', 6_000_000)
+        self._request_bucket = TokenBucket(rate=requests_per_second, capacity=2 * requests_per_second)
+        self._char_bucket = TokenBucket(rate=chars_per_minute / 60, capacity=chars_per_minute)
+        
+        # A successful connection test is trusted for a while instead of probing again
+        self.connection_test_ttl = translation_settings.get('connection_test_ttl', 300)
+        self._connection_ok_until = 0.0
         
         self.logger.info("PPTransTranslator initialized with Google Cloud API (paid tier)")
         
     def _initialize_google_client(self):
         """Initialize Google Translate client with credentials from local directory."""
         try:
+            # The Google client libraries are heavy to import, so they load on first use
+            from google.oauth2 import service_account
+            
             credentials_path = None
             
             # Method 1: Try local credentials directory FIRST (for PPTrans project)
-            project_root = Path(__file__).parent.parent.parent
-            potential_paths = [
-                project_root / "credentials" / "google-translate-key.json",
-                project_root / "credentials" / "service-account-key.json", 
-                project_root / "credentials" / "google-cloud-key.json",
-            ]
-            
-            for path in potential_paths:
-                if path.exists():
-                    credentials_path = str(path.absolute())
-                    self.logger.info(f"Using local credentials: {credentials_path}")
-                    break
+            path = _first_existing_path(CREDENTIALS_PATHS)
+            if path is not None:
+                credentials_path = str(path.absolute())
+                self.logger.info(f"Using local credentials: {credentials_path}")
             
             if credentials_path:
                 # Load credentials explicitly from local file
                 credentials = service_account.Credentials.from_service_account_file(credentials_path)
-                client = translate.Client(credentials=credentials)
+                client = self._create_client(credentials, credentials.project_id)
             else:
                 # Fallback: try environment variable (but warn about it)
                 env_var = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
                 if env_var:
                     self.logger.warning(f"No local credentials found, falling back to environment variable: {env_var}")
-                    client = translate.Client()
+                    client = self._create_client()
                 else:
                     raise FileNotFoundError("No credentials found")
             
@@ -95,6 +371,37 @@ class PPTransTranslator(LoggerMixin):
             
             raise TranslationError(error_msg)
     
+    def _create_client(self, credentials=None, project_id: Optional[str] = None):
+        """
+        Create the Cloud Translation client for the configured 'api_version'
+        
+        v3 (default) talks gRPC over a persistent channel but bills a Google Cloud project;
+        the 'project_id' setting wins over the credentials' project. Without any project
+        the older v2 REST client is used instead.
+        """
+        if self.api_version == 'v3':
+            project_id = self.settings.get('project_id') or project_id or self._default_project_id()
+            if project_id:
+                self.logger.info(f"Using Cloud Translation API v3 for project: {project_id}")
+                return TranslationServiceV3Client(credentials=credentials, project_id=project_id)
+            
+            self.logger.warning("No Google Cloud project found for Cloud Translation API v3, using v2 instead "
+                                "(set translation.project_id to use v3)")
+            self.api_version = 'v2'
+        
+        from google.cloud import translate_v2
+        return translate_v2.Client(credentials=credentials)
+    
+    def _default_project_id(self) -> Optional[str]:
+        """Project of the application default credentials, or None if there is none"""
+        try:
+            import google.auth
+            _, project_id = google.auth.default()
+            return project_id
+        except Exception as e:
+            self.logger.debug("No default Google Cloud project: %s", e)
+            return None
+    
     def _test_api_connection(self, client):
         """Test API connection with a simple translation."""
         try:
@@ -111,83 +418,37 @@ class PPTransTranslator(LoggerMixin):
         except Exception as e:
             raise ConnectionError(f"Google Cloud Translation API connection failed: {e}")
         
-    def _compile_skip_patterns(self) -> List[re.Pattern]:
-        """Patterns for content that shouldn't be translated (preserved from original)"""
-        patterns = [
-            re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'),  # Email
-            re.compile(r'^[\+\d\s\-\(\)☎📧]{6,}$'),  # Phone numbers and symbols
-            re.compile(r'^https?://'),  # URLs
-            re.compile(r'^[^\w\s]{1,3}$'),  # Single symbols/punctuation
-            re.compile(r'^\d+$'),  # Numbers only
-            re.compile(r'^[A-Z][a-z]+ [A-Z][a-z]+$'),  # Names (First Last)
-            re.compile(r'^\s*[\.,;:!\?|►▪•♦<>]+\s*$'),  # Punctuation/symbols
-            re.compile(r'^.{1,2}$'),  # Very short content
-        ]
-        return patterns
-    
-    def _load_enhanced_context_terms(self) -> Dict[str, str]:
-        """Enhanced context-specific terms with better German academic vocabulary (preserved from original)"""
-        return {
-            # University/Academic terms
-            'Erstsemestertag': 'First Semester Orientation Day',
-            'Studierende': 'students',
-            'Studierenden': 'students',  # Different case
-            'Studiengang': 'degree program',
-            'Hochschule Heilbronn': 'Heilbronn University of Applied Sciences',
-            'Heilbronn': 'Heilbronn',
-            'Standort': 'location',  # This was causing the repetition
-            'Standortes': 'location',
-            'des Standortes': 'of the campus',  # Better contextual translation
-            'am Standort': 'at the campus',
-            'für den Standort': 'for the campus',
-            
-            # Student organization terms
-            'Vertritt die Interessen': 'Represents the interests',
-            'Plant Veranstaltungen': 'Plans events',
-            'Seien Sie aktiv': 'Be active',
-            'engagieren Sie sich': 'get involved',
-            
-            # Academic activities
-            'Veranstaltungen': 'events',
-            'Vorlesung': 'lecture',
-            'Seminar': 'seminar',
-            'Übung': 'tutorial',
-            'Prüfung': 'exam',
-            'Semester': 'semester',
-            'Campus': 'campus',
-            
-            # General German terms that are often mistranslated
-            'aller Art': 'of all kinds',
-            'sich engagieren': 'get involved',
-            'aktiv sein': 'be active',
-            
-            # Keep German place names
-            'Deutschland': 'Germany',
-            'Baden-Württemberg': 'Baden-Württemberg',
-            
-            # Names and titles that shouldn't be translated
-            'GDM': 'GDM',
-            'Ani Antonyan': 'Ani Antonyan',
-            'mv-international': 'mv-international',
-            'hs-heilbronn.de': 'hs-heilbronn.de',
-        }
+    def _compile_skip_patterns(self) -> re.Pattern:
+        """Patterns for content that shouldn't be translated (compiled once at import)"""
+        return SKIP_PATTERN
+    
+    def _load_enhanced_context_terms(self) -> Mapping[str, str]:
+        """Enhanced context-specific terms with better German academic vocabulary (shared, read-only)"""
+        return CONTEXT_TERMS
     
     def _should_skip_translation(self, text: str) -> bool:
         """Check if text should be skipped entirely (preserved from original)"""
-        if not text or not text.strip():
+        stripped = text.strip() if text else ''
+        if not stripped:
+            return True
+        
+        return self._is_skippable(stripped)
+    
+    def _match_skip_rules(self, text_clean: str) -> bool:
+        """Apply the skip rules to stripped, non-empty text (called through the _is_skippable cache)"""
+        # Decide the common cases (very short, digits only, URLs) without the regex engine
+        if len(text_clean) <= 2 or text_clean.isdecimal() or text_clean.startswith(('http://', 'https://')):
+            self.logger.debug("Skipping translation (pattern match): '%s'", text_clean)
             return True
-            
-        text_clean = text.strip()
         
         # Check skip patterns
-        for pattern in self.skip_patterns:
-            if pattern.match(text_clean):
-                self.logger.debug(f"Skipping translation (pattern match): '{text_clean}'")
-                return True
+        if self.skip_patterns.match(text_clean):
+            self.logger.debug("Skipping translation (pattern match): '%s'", text_clean)
+            return True
         
         # Skip if only whitespace or punctuation
-        if not re.search(r'\w', text_clean):
-            self.logger.debug(f"Skipping translation (no words): '{text_clean}'")
+        if not _WORD_CHAR_RE.search(text_clean):
+            self.logger.debug("Skipping translation (no words): '%s'", text_clean)
             return True
             
         return False
@@ -197,19 +458,7 @@ class PPTransTranslator(LoggerMixin):
         glossary = {}
         
         # Try to find glossary file
-        project_root = Path(__file__).parent.parent.parent
-        glossary_paths = [
-            project_root / "academic_glossary.txt",
-            project_root / "config" / "academic_glossary.txt",
-            project_root / "resources" / "academic_glossary.txt",
-        ]
-        
-        glossary_file = None
-        for path in glossary_paths:
-            if path.exists():
-                glossary_file = path
-                break
-        
+        glossary_file = _first_existing_path(GLOSSARY_PATHS)
         if not glossary_file:
             self.logger.warning("No external glossary file found, using built-in terms")
             return self._get_fallback_glossary()
@@ -251,60 +500,86 @@ class PPTransTranslator(LoggerMixin):
             'college': 'University of Applied Sciences',
         }
     
+    def _output_fingerprint(self) -> str:
+        """Short hash of the glossary, repetition fixes and API version that shape translated output"""
+        digest = hashlib.sha256()
+        digest.update(repr(sorted(self.glossary_terms.items())).encode('utf-8'))
+        digest.update(repr(list(REPETITION_FIXES.items())).encode('utf-8'))
+        digest.update(self.api_version.encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
     def _apply_glossary_fixes(self, translated_text: str) -> str:
         """Apply academic term glossary fixes after Google translation"""
         if not translated_text:
             return translated_text
             
-        fixed = translated_text
-        
-        # Apply glossary fixes loaded from external file
-        for source_term, target_term in self.glossary_terms.items():
-            if source_term in fixed.lower():
-                # Use regex for case-insensitive replacement while preserving case context
-                pattern = re.compile(re.escape(source_term), re.IGNORECASE)
-                fixed = pattern.sub(target_term, fixed)
-                self.logger.debug(f"Glossary fix: {source_term} -> {target_term}")
+        if self._glossary_pattern is None:
+            return translated_text
         
-        return fixed
+        # Apply glossary fixes loaded from external file (case-insensitive, longest term wins)
+        return self._glossary_pattern.sub(self._replace_glossary_term, translated_text)
+    
+    def _replace_glossary_term(self, match: re.Match) -> str:
+        """Replacement for one glossary match"""
+        source_term = match.group(0)
+        target_term = self.glossary_terms.get(source_term.lower(), source_term)
+        self.logger.debug("Glossary fix: %s -> %s", source_term, target_term)
+        return target_term
     
     def _postprocess_translation(self, original: str, translated: str) -> str:
         """Post-process translation to fix common issues (preserved from original)"""
         if not translated or translated == original:
             return translated
         
-        fixed = translated
+        if _REPETITION_TRIGGER not in translated.lower():
+            return translated
         
         # Fix common repetition patterns
-        repetition_fixes = {
-            'of the location of the location': 'of the campus',
-            'the location of the location': 'the campus',
-            'for the location': 'for the campus',
-            'at the location': 'at the campus',
-            'students of the location': 'students at the campus',
-        }
-        
-        for bad_phrase, good_phrase in repetition_fixes.items():
-            if bad_phrase in fixed.lower():
-                fixed = re.sub(re.escape(bad_phrase), good_phrase, fixed, flags=re.IGNORECASE)
-                self.logger.debug(f"Post-processing fix: {bad_phrase} -> {good_phrase}")
+        fixed = translated
+        for bad_phrase, pattern, good_phrase in _REPETITION_PATTERNS:
+            fixed, count = pattern.subn(good_phrase, fixed)
+            if count:
+                self.logger.debug("Post-processing fix: %s -> %s", bad_phrase, good_phrase)
         
         return fixed
     
     def _track_api_usage(self):
         """Track API usage (much more generous limits with paid API)"""
-        current_time = time.time()
-        
-        # Reset hourly counter
-        if current_time - self.hour_start_time > 3600:
-            self.request_count = 0
-            self.hour_start_time = current_time
-        
-        self.request_count += 1
+        with self._usage_lock:
+            current_time = time.time()
+            
+            # Reset hourly counter
+            if current_time - self.hour_start_time > 3600:
+                self.request_count = 0
+                self.hour_start_time = current_time
+            
+            self.request_count += 1
+            request_count = self.request_count
         
         # Log usage but don't enforce strict limits (paid API is very generous)
-        if self.request_count % 100 == 0:
-            self.logger.info(f"API usage: {self.request_count} requests in current hour")
+        if request_count % 100 == 0:
+            self.logger.info(f"API usage: {request_count} requests in current hour")
+    
+    def _get_memoized(self, key: Tuple[Optional[str], str, str]) -> Optional[str]:
+        """Get a remembered translation and mark it as recently used"""
+        with self._memo_lock:
+            translation = self._translation_memo.get(key)
+            if translation is not None:
+                self._translation_memo.move_to_end(key)
+            return translation
+    
+    def _memoize(self, key: Tuple[Optional[str], str, str], translation: str) -> None:
+        """Remember a translation, dropping the least recently used one beyond memo_size"""
+        with self._memo_lock:
+            self._translation_memo[key] = translation
+            self._translation_memo.move_to_end(key)
+            if len(self._translation_memo) > self._memo_size:
+                self._translation_memo.popitem(last=False)
+    
+    def _wait_for_quota(self, char_count: int) -> None:
+        """Block until one more request with char_count characters fits the configured rate limits"""
+        self._request_bucket.acquire(1)
+        self._char_bucket.acquire(char_count)
     
     def translate_text(self, text: str, source_lang: str = 'de', target_lang: str = 'en') -> str:
         """
@@ -316,7 +591,13 @@ class PPTransTranslator(LoggerMixin):
         if self._should_skip_translation(text):
             return text
         
+        memo_key = (source_lang, target_lang, text)
+        cached = self._get_memoized(memo_key)
+        if cached is not None:
+            return cached
+        
         try:
+            self._wait_for_quota(len(text))
             self._track_api_usage()
             
             # Send directly to Google Translate with explicit German source
@@ -337,101 +618,189 @@ class PPTransTranslator(LoggerMixin):
             if final_translation != text:
                 self.logger.debug(f"Translated: '{text}' -> '{final_translation}'")
             
+            self._memoize(memo_key, final_translation)
             return final_translation
             
         except Exception as e:
             self.logger.error(f"Translation failed for '{text[:30]}...': {e}")
             return text  # Return original on error
     
-    def translate_text_batch(self, text_items: List[str], source_lang: str = 'de', target_lang: str = 'en') -> List[str]:
+    def translate_text_batch(self, text_items: List[str], source_lang: str = 'de', target_lang: str = 'en',
+                             batch_callback: Optional[Callable[[Dict[int, str]], None]] = None) -> List[str]:
         """
         Translate multiple text items using reliable batch processing
         Now enabled again with paid Google Cloud API!
+        
+        Args:
+            text_items: Texts to translate
+            source_lang: Source language code (None lets the API detect it)
+            target_lang: Target language code
+            batch_callback: Called in the calling thread with {position: translation} for the
+                items each finished request covers (skipped and remembered items come first)
+            
+        Returns:
+            Translations in the order of text_items
         """
         if not text_items:
             return []
         
+        translated_items = [''] * len(text_items)
+        
         if not self.use_batching:
-            # Fall back to individual translation if batching disabled
+            # Fall back to individual translation if batching disabled; each text is its own
+            # request, so several are kept in flight (throttled by the rate limiters)
             self.logger.info("Batch processing disabled, using individual translation")
-            return [self.translate_text(text, source_lang, target_lang) for text in text_items]
+            
+            def translate_item(index: int) -> Dict[int, str]:
+                return {index: self.translate_text(text_items[index], source_lang, target_lang)}
+            
+            max_workers = min(self.max_concurrency, len(text_items))
+            for finished in _completed_results(translate_item, range(len(text_items)), max_workers):
+                for index, translation in finished.items():
+                    translated_items[index] = translation
+                if batch_callback:
+                    batch_callback(finished)
+            return translated_items
         
         self.logger.info(f"Batch translating {len(text_items)} items with Google Cloud API")
         
-        # Separate items that need translation from those that should be skipped
-        translatable_items = []
-        skipped_indices = set()
-        translated_items = [''] * len(text_items)
+        # Separate items that need translation from those that should be skipped;
+        # repeated texts are sent once and their result copied to every position
+        pending_indices: Dict[str, List[int]] = {}
+        resolved_indices = []
+        skipped_count = 0
+        successful_translations = 0
+        
+        # Bind hot-loop lookups to locals once per call
+        should_skip = self._should_skip_translation
+        get_memoized = self._get_memoized
+        debug = self.logger.debug
         
         for i, text in enumerate(text_items):
-            if self._should_skip_translation(text):
-                skipped_indices.add(i)
+            if should_skip(text):
+                skipped_count += 1
                 translated_items[i] = text  # Keep original
-                self.logger.debug(f"Skipped item {i+1}: '{text[:30]}...'")
+                resolved_indices.append(i)
+                debug("Skipped item %d: '%.30s...'", i + 1, text)
+                continue
+            
+            # Texts translated earlier in this session are not sent again
+            cached = get_memoized((source_lang, target_lang, text))
+            if cached is not None:
+                translated_items[i] = cached
+                resolved_indices.append(i)
+                if cached != text:
+                    successful_translations += 1
             else:
-                translatable_items.append((i, text))
+                pending_indices.setdefault(text, []).append(i)
+        
+        if batch_callback and resolved_indices:
+            batch_callback({i: translated_items[i] for i in resolved_indices})
         
+        translatable_items = list(pending_indices.items())
         if not translatable_items:
-            self.logger.info("No items to translate (all skipped)")
+            self.logger.info("No items to translate (all skipped or already translated)")
             return translated_items
         
-        # Process in batches
-        for batch_start in range(0, len(translatable_items), self.batch_size):
-            batch_end = min(batch_start + self.batch_size, len(translatable_items))
-            batch = translatable_items[batch_start:batch_end]
-            
-            try:
-                self._track_api_usage()
-                
-                # Extract texts for batch translation
-                batch_texts = [item[1] for item in batch]  # original text
-                
-                # Batch translate using Google Cloud API
-                results = self.client.translate(
-                    batch_texts,
-                    source_language=source_lang,
-                    target_language=target_lang
-                )
-                
-                # Apply translations back to original positions
-                for (original_index, original_text), result in zip(batch, results):
-                    translated = result['translatedText']
-                    
-                    # Post-process and apply glossary fixes
-                    final_translation = self._postprocess_translation(original_text, translated)
-                    final_translation = self._apply_glossary_fixes(final_translation)
+        # Process in batches of up to batch_size texts and chunk_size characters;
+        # API round trips dominate, so several batches can be in flight at once
+        batches = list(_pack_batches(translatable_items, self.max_chars_per_request, self.batch_size))
+        
+        def translate_batch(numbered_batch: Tuple[int, List[Tuple[str, List[int]]]]) -> List[Tuple[List[int], str]]:
+            batch_number, batch = numbered_batch
+            return self._translate_one_batch(batch, batch_number, source_lang, target_lang)
+        
+        # Apply translations back to original positions as batches finish, counting changed items as we go
+        max_workers = min(self.max_concurrency, len(batches))
+        for batch_result in _completed_results(translate_batch, enumerate(batches, 1), max_workers):
+            finished = {}
+            for original_indices, final_translation in batch_result:
+                for original_index in original_indices:
                     translated_items[original_index] = final_translation
-                    
-                    if final_translation != original_text:
-                        self.logger.debug(f"Batch translated item {original_index+1}: '{original_text[:30]}...' -> '{final_translation[:30]}...'")
-                
-                self.logger.info(f"Batch {batch_start//self.batch_size + 1}: Processed {len(batch)} items")
-                
-            except Exception as e:
-                self.logger.error(f"Batch translation failed for batch {batch_start//self.batch_size + 1}: {e}")
-                # Fallback to individual translation for this batch
-                for original_index, original_text in batch:
-                    try:
-                        individual_result = self.translate_text(original_text, source_lang, target_lang)
-                        translated_items[original_index] = individual_result
-                    except Exception as individual_error:
-                        self.logger.error(f"Individual fallback failed for item {original_index+1}: {individual_error}")
-                        translated_items[original_index] = original_text  # Keep original
-        
-        # Calculate success statistics
-        successful_translations = sum(1 for i, item in enumerate(translated_items) 
-                                    if i not in skipped_indices and item != text_items[i])
-        
-        self.logger.info(f"Batch translation completed: {successful_translations}/{len(text_items) - len(skipped_indices)} items translated, {len(skipped_indices)} skipped")
+                    finished[original_index] = final_translation
+                if final_translation != text_items[original_indices[0]]:
+                    successful_translations += len(original_indices)
+            if batch_callback:
+                batch_callback(finished)
+        
+        self.logger.info(f"Batch translation completed: {successful_translations}/{len(text_items) - skipped_count} items translated, {skipped_count} skipped")
         
         return translated_items
     
+    def _translate_one_batch(self, batch: List[Tuple[str, List[int]]], batch_number: int,
+                             source_lang: str, target_lang: str) -> List[Tuple[List[int], str]]:
+        """
+        Translate one API batch, falling back to individual translation if the batch call fails
+        
+        Args:
+            batch: (original text, positions in the caller's list) pairs
+            batch_number: 1-based batch number for logging
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            List of (positions, final translation) pairs
+        """
+        batch_result = []
+        
+        try:
+            # Extract texts for batch translation
+            batch_texts = [item[0] for item in batch]  # original text
+            
+            self._wait_for_quota(sum(map(len, batch_texts)))
+            self._track_api_usage()
+            
+            # Batch translate using Google Cloud API
+            results = self.client.translate(
+                batch_texts,
+                source_language=source_lang,
+                target_language=target_lang
+            )
+            
+            # Bind hot-loop lookups to locals once per batch
+            postprocess_translation = self._postprocess_translation
+            apply_glossary_fixes = self._apply_glossary_fixes
+            memoize = self._memoize
+            append_result = batch_result.append
+            
+            for (original_text, original_indices), result in zip(batch, results):
+                translated = result['translatedText']
+                
+                # Post-process and apply glossary fixes
+                final_translation = apply_glossary_fixes(postprocess_translation(original_text, translated))
+                append_result((original_indices, final_translation))
+                memoize((source_lang, target_lang, original_text), final_translation)
+                
+                if final_translation != original_text:
+                    self.logger.debug("Batch translated item %d: '%.30s...' -> '%.30s...'",
+                                      original_indices[0] + 1, original_text, final_translation)
+            
+            self.logger.info(f"Batch {batch_number}: Processed {len(batch)} unique items")
+            
+        except Exception as e:
+            self.logger.error(f"Batch translation failed for batch {batch_number}: {e}")
+            # Fallback to individual translation for this batch
+            batch_result = []
+            for original_text, original_indices in batch:
+                try:
+                    individual_result = self.translate_text(original_text, source_lang, target_lang)
+                except Exception as individual_error:
+                    self.logger.error(f"Individual fallback failed for item {original_indices[0]+1}: {individual_error}")
+                    individual_result = original_text  # Keep original
+                batch_result.append((original_indices, individual_result))
+        
+        return batch_result
+    
     def test_connection(self) -> bool:
         """Test connection to Google Cloud Translation service"""
+        if time.monotonic() < self._connection_ok_until:
+            return True
+        
         try:
             test_result = self.translate_text("Studierende besuchen Vorlesungen", source_lang='de', target_lang='en')
             success = test_result.lower() != "studierende besuchen vorlesungen" and test_result.strip() != ""
             if success:
+                self._connection_ok_until = time.monotonic() + self.connection_test_ttl
                 self.logger.info(f"Connection test successful: 'Studierende besuchen Vorlesungen' -> '{test_result}'")
             else:
                 self.logger.error(f"Connection test failed - got: '{test_result}'")
@@ -449,9 +818,10 @@ class PPTransTranslator(LoggerMixin):
             'requests_made': self.request_count,
             'time_in_current_hour': int(time_in_current_hour),
             'time_until_reset': max(0, int(3600 - time_in_current_hour)),
-            'api_type': 'Google Cloud Translation API (Paid)',
+            'api_type': f"Google Cloud Translation API {self.api_version} (Paid)",
             'batch_processing_enabled': self.use_batching,
-            'batch_size': self.batch_size
+            'batch_size': self.batch_size,
+            'chunk_size': self.max_chars_per_request
         }
     
     def get_supported_languages(self) -> List[Dict[str, str]]:
@@ -48,6 +48,7 @@ class SettingsDialog:
             'backup_original': self.config.get('advanced.backup_original', True),
             'parallel_processing': self.config.get('advanced.parallel_processing', False),
             'max_workers': self.config.get('advanced.max_workers', 4),
+            'cache_translations': self.config.get('advanced.cache_translations', False),
             
             # Logging settings
             'log_level': self.config.get('logging.level', 'INFO'),
@@ -230,7 +231,11 @@ class SettingsDialog:
         
         self.backup_original_var = tk.BooleanVar(value=self.settings['backup_original'])
         ttk.Checkbutton(pptx_group, text="Create backup of original file", 
-                       variable=self.backup_original_var).pack(anchor="w")
+                       variable=self.backup_original_var).pack(anchor="w", pady=(0, 5))
+        
+        self.cache_translations_var = tk.BooleanVar(value=self.settings['cache_translations'])
+        ttk.Checkbutton(pptx_group, text="Remember translations on disk for later runs", 
+                       variable=self.cache_translations_var).pack(anchor="w")
         
         # Performance options
         perf_group = ttk.LabelFrame(frame, text="Performance", padding="10")
@@ -337,6 +342,7 @@ class SettingsDialog:
         self.backup_original_var.set(self.settings['backup_original'])
         self.parallel_processing_var.set(self.settings['parallel_processing'])
         self.max_workers_var.set(str(self.settings['max_workers']))
+        self.cache_translations_var.set(self.settings['cache_translations'])
         
         # Logging settings
         self.log_level_var.set(self.settings['log_level'])
@@ -367,6 +373,7 @@ class SettingsDialog:
                 'advanced.backup_original': self.backup_original_var.get(),
                 'advanced.parallel_processing': self.parallel_processing_var.get(),
                 'advanced.max_workers': int(self.max_workers_var.get()),
+                'advanced.cache_translations': self.cache_translations_var.get(),
                 
                 'logging.level': self.log_level_var.get(),
                 'logging.console_output': self.console_output_var.get(),
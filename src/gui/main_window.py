@@ -14,7 +14,7 @@ from utils.config import Config
 from utils.exceptions import create_user_friendly_message
 from core.translator import PPTransTranslator
 from core.pptx_processor import PPTXProcessor
-from core.language_manager import LanguageManager
+from core.language_manager import get_language_manager
 from .widgets import ProgressDialog, AboutDialog
 from .dialogs import SettingsDialog
 
@@ -25,8 +25,8 @@ class PPTransMainWindow(LoggerMixin):
         """Initialize the main window"""
         self.config = Config()
         self.translator = PPTransTranslator(self.config.get_translation_settings())
-        self.processor = PPTXProcessor(self.config.get_section("advanced"))
-        self.language_manager = LanguageManager()
+        self.processor = PPTXProcessor(self.config.get_section("advanced"), translator=self.translator)
+        self.language_manager = get_language_manager()
         
         # GUI state
         self.root = None
@@ -317,8 +317,7 @@ class PPTransMainWindow(LoggerMixin):
         try:
             # Load presentation to get info - FIX: Pass advanced_settings from config
             processor = PPTXProcessor(self.config.get_section("advanced"))
-            processor.load_presentation(self.current_file)
-            info = processor.get_presentation_info()
+            info = processor.peek_presentation_info(self.current_file)
             
             info_text = f"Slides: {info.get('total_slides', 0)}"
             file_size = os.path.getsize(self.current_file) / (1024 * 1024)  # MB
@@ -384,16 +383,14 @@ class PPTransMainWindow(LoggerMixin):
             # Create progress dialog
             self.root.after(0, self._create_progress_dialog, len(text_elements))
             
-            # Translation function with progress updates
-            def translate_with_progress(text: str) -> str:
-                translated = self.translator.translate_text(text, source_lang, target_lang)
-                if self.progress_dialog:
-                    self.progress_dialog.increment()
-                return translated
+            # Progress updates arrive once per translated batch
+            def report_progress(completed: int):
+                self.root.after(0, self._increment_progress, completed)
             
             # Perform translations
             self.status_var.set("Translating text...")
-            self.processor.translate_text_elements(translate_with_progress)
+            self.processor.translate_text_elements(source_lang=source_lang, target_lang=target_lang,
+                                                   progress_callback=report_progress)
             
             # Apply translations
             self.status_var.set("Applying translations...")
@@ -430,6 +427,11 @@ class PPTransMainWindow(LoggerMixin):
         self.progress_dialog = ProgressDialog(self.root, total_items)
         self.progress_dialog.show()
     
+    def _increment_progress(self, amount: int):
+        """Advance the progress dialog (runs on the GUI thread)"""
+        if self.progress_dialog:
+            self.progress_dialog.increment(amount)
+    
     def _close_progress_dialog(self):
         """Close progress dialog"""
         if self.progress_dialog:
@@ -540,6 +542,7 @@ class PPTransMainWindow(LoggerMixin):
                 return
         
         self._save_window_state()
+        self.processor.close()
         self.logger.info("Application closing")
         self.root.quit()
     
@@ -31,7 +31,18 @@ class Config(LoggerMixin):
             "chunk_size": 5000,
             "max_retries": 3,
             "retry_delay": 1.0,
-            "timeout": 30
+            "timeout": 30,
+            # Cloud Translation API: "v3" (gRPC, needs a project) or "v2" (REST)
+            "api_version": "v3",
+            "project_id": None,  # None: project of the service account key / default credentials
+            # Batching and throughput; chunk_size is the character budget per API request
+            "use_batching": True,
+            "batch_size": 50,
+            "max_concurrency": 8,
+            "memo_size": 4096,
+            "max_requests_per_second": 100,
+            "max_chars_per_minute": 6000000,
+            "connection_test_ttl": 300
         },
         "logging": {
             "level": "INFO",
@@ -43,7 +54,16 @@ class Config(LoggerMixin):
             "preserve_animations": True,
             "backup_original": True,
             "parallel_processing": False,
-            "max_workers": 4
+            "max_workers": 4,
+            "extract_workers": None,  # None: use max_workers for slide extraction too
+            "fast_parser": True,
+            "stream_apply": True,
+            "incremental_save": True,
+            "max_in_memory_bytes": 536870912,  # Larger decks are memory-mapped instead of read into memory
+            # Persistent translation cache (stores slide text on disk, so it is opt-in)
+            "cache_translations": False,
+            "translation_cache_file": None,  # None: per-user default location
+            "translation_cache_max_entries": 100000
         }
     }
     
@@ -0,0 +1,158 @@
+"""
+Persistent translation cache for PPTrans
+Stores finished translations on disk so repeated text is not sent to the API again
+"""
+
+import hashlib
+import shelve
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+from .logger import LoggerMixin
+
+def get_cache_file() -> Path:
+    """Get the translation cache file path, create its directory if it doesn't exist"""
+    if getattr(sys, 'frozen', False):
+        # Running as compiled executable
+        cache_dir = Path(sys.executable).parent / "cache"
+    else:
+        # Running as script
+        cache_dir = Path.home() / ".pptrans"
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / "translation_cache"
+
+class TranslationCache(LoggerMixin):
+    """
+    On-disk translation cache keyed by SHA-256 of the output fingerprint, language pair and source text
+
+    Entries are final translations, so callers pass a fingerprint of everything else that
+    shapes the output (glossary, post-processing, API version); changing any of those
+    makes the old entries unreachable. Once the file holds more than max_entries, the
+    oldest entries are dropped when it is next opened.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, memory_size: int = 4096, max_entries: int = 100_000):
+        """
+        Initialize translation cache
+
+        Args:
+            cache_file: Path of the shelve database (default: per-user cache file)
+            memory_size: Number of recent entries kept in memory in front of the shelf
+            max_entries: Entry limit for the shelf, enforced when it is opened (0 for no limit)
+        """
+        self.cache_file = cache_file
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._shelf = None
+        self._shelf_failed = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str, source_lang: str, target_lang: str, fingerprint: str = '') -> str:
+        """Build the cache key for a text, language pair and output fingerprint"""
+        return hashlib.sha256(f"{fingerprint}\0{source_lang}\0{target_lang}\0{text}".encode('utf-8')).hexdigest()
+
+    def _get_shelf(self):
+        """Open the shelf on first use (callers hold the lock)"""
+        if self._shelf is None and not self._shelf_failed:
+            try:
+                cache_file = self.cache_file or get_cache_file()
+                self._shelf = shelve.open(str(cache_file))
+                self.logger.info(f"Translation cache opened: {cache_file}")
+                self._trim(self._shelf)
+            except Exception as e:
+                # Keep working with the in-memory cache only
+                self._shelf_failed = True
+                self.logger.warning(f"Could not open translation cache, using memory only: {e}")
+        return self._shelf
+
+    def _trim(self, shelf) -> None:
+        """Drop the oldest entries once the shelf outgrows max_entries (callers hold the lock)"""
+        if not self.max_entries or len(shelf) <= self.max_entries:
+            return
+
+        # Trim to 90% so the full scan doesn't repeat on every open
+        keep = self.max_entries * 9 // 10
+        try:
+            stored_at = {}
+            for key in shelf.keys():
+                entry = shelf.get(key)
+                stored_at[key] = entry[0] if isinstance(entry, tuple) else 0.0
+            oldest = sorted(stored_at, key=stored_at.get)[:len(stored_at) - keep]
+            for key in oldest:
+                del shelf[key]
+            self.logger.info(f"Translation cache trimmed: {len(oldest)} old entries removed")
+        except Exception as e:
+            self.logger.warning(f"Error trimming translation cache: {e}")
+
+    def _remember(self, key: str, translation: str) -> None:
+        """Store an entry in the in-memory LRU (callers hold the lock)"""
+        self._memory[key] = translation
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, text: str, source_lang: str, target_lang: str, fingerprint: str = '') -> Optional[str]:
+        """Get a cached translation, or None if the text has not been translated before"""
+        key = self.make_key(text, source_lang, target_lang, fingerprint)
+
+        with self._lock:
+            translation = self._memory.get(key)
+            if translation is not None:
+                self._memory.move_to_end(key)
+                return translation
+
+            shelf = self._get_shelf()
+            if shelf is None:
+                return None
+
+            try:
+                entry = shelf.get(key)
+            except Exception as e:
+                self.logger.debug("Error reading translation cache: %s", e)
+                return None
+
+            # Entries are (time stored, translation); anything else is from an older format
+            if not isinstance(entry, tuple):
+                return None
+            translation = entry[1]
+            self._remember(key, translation)
+            return translation
+
+    def set(self, text: str, source_lang: str, target_lang: str, translation: str, fingerprint: str = '') -> None:
+        """Store a translation"""
+        key = self.make_key(text, source_lang, target_lang, fingerprint)
+
+        with self._lock:
+            self._remember(key, translation)
+
+            shelf = self._get_shelf()
+            if shelf is not None:
+                try:
+                    shelf[key] = (time.time(), translation)
+                except Exception as e:
+                    self.logger.debug("Error writing translation cache: %s", e)
+
+    def sync(self) -> None:
+        """Flush pending writes to disk"""
+        with self._lock:
+            if self._shelf is not None:
+                try:
+                    self._shelf.sync()
+                except Exception as e:
+                    self.logger.warning(f"Error flushing translation cache: {e}")
+
+    def close(self) -> None:
+        """Flush and close the cache file"""
+        with self._lock:
+            if self._shelf is not None:
+                try:
+                    self._shelf.close()
+                except Exception as e:
+                    self.logger.warning(f"Error closing translation cache: {e}")
+                self._shelf = None
@@ -0,0 +1,343 @@
+"""
+Tests for the PowerPoint processor
+"""
+
+import io
+import struct
+import tempfile
+import unittest
+import sys
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from core.pptx_processor import PPTXProcessor, _parse_slide_range
+from utils.exceptions import PPTXProcessingError
+from tests.test_translator import SlowClient, make_translator
+
+
+def make_deck(path: Path, slide_texts, streamed: bool = False) -> None:
+    """
+    Write a deck with one text box per slide
+    
+    With streamed the zip entries are laid out the way streaming zip writers do it: CRC and
+    sizes follow the data in a data descriptor (flag bit 3), and the local headers carry an
+    extra field.
+    """
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    presentation = Presentation()
+    for text in slide_texts:
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = text
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+
+    if not streamed:
+        path.write_bytes(buffer.getvalue())
+        return
+
+    class Unseekable(io.RawIOBase):
+        def __init__(self, target):
+            self.target = target
+
+        def writable(self):
+            return True
+
+        def write(self, data):
+            return self.target.write(data)
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as source, \
+            zipfile.ZipFile(Unseekable(output), 'w') as target:
+        for info in source.infolist():
+            streamed_info = zipfile.ZipInfo(info.filename, info.date_time)
+            streamed_info.compress_type = zipfile.ZIP_DEFLATED
+            streamed_info.extra = struct.pack('<HH4s', 0xCAFE, 4, b'test')
+            target.writestr(streamed_info, source.read(info))
+    path.write_bytes(output.getvalue())
+
+
+def assert_local_headers_match(test: unittest.TestCase, path: Path) -> None:
+    """Check every local header against the central directory, as strict zip readers do"""
+    data = path.read_bytes()
+    with zipfile.ZipFile(path) as package:
+        test.assertIsNone(package.testzip())
+        for info in package.infolist():
+            header = struct.unpack(zipfile.structFileHeader,
+                                   data[info.header_offset:info.header_offset + zipfile.sizeFileHeader])
+            flag_bits, crc, compress_size, file_size = header[3], header[7], header[8], header[9]
+            test.assertFalse(flag_bits & 0x08, info.filename)
+            test.assertEqual((crc, compress_size, file_size), (info.CRC, info.compress_size, info.file_size),
+                             info.filename)
+
+
+def slide_texts(path) -> list:
+    """Text of every text frame, per slide"""
+    from pptx import Presentation
+    return [[shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+            for slide in Presentation(str(path)).slides]
+
+
+def make_element(element_id: int, text: str) -> dict:
+    """Extracted paragraph element as produced by extract_text_elements"""
+    return {
+        'id': element_id,
+        'slide_index': 0,
+        'shape_index': 0,
+        'paragraph_index': element_id,
+        'type': 'paragraph',
+        'original_text': text,
+        'translated_text': None,
+        'paragraph_formatting': {},
+        'runs': [{'run_index': 0, 'text': text, 'formatting': {}}]
+    }
+
+
+class TestParseSlideRange(unittest.TestCase):
+    """Slide range specifications"""
+
+    def test_numbers_and_ranges(self):
+        self.assertEqual(_parse_slide_range('1-3,5', 6), ((0, 1, 2, 4), ()))
+
+    def test_duplicates_and_order(self):
+        self.assertEqual(_parse_slide_range('4, 2,2,1-2', 5), ((0, 1, 3), ()))
+
+    def test_ranges_are_clamped_and_may_be_reversed(self):
+        self.assertEqual(_parse_slide_range('4-10', 5), ((3, 4), ()))
+        self.assertEqual(_parse_slide_range('3-1', 5), ((0, 1, 2), ()))
+
+    def test_out_of_range_numbers_are_ignored(self):
+        self.assertEqual(_parse_slide_range('0,9', 5), ((), ()))
+        self.assertEqual(_parse_slide_range('1-3', 0), ((), ()))
+
+    def test_invalid_parts_are_reported(self):
+        indices, invalid_parts = _parse_slide_range('1, a, 2-b,', 5)
+        self.assertEqual(indices, (0,))
+        self.assertEqual(invalid_parts, ('Invalid slide number: a', 'Invalid range format: 2-b'))
+
+    def test_all_slides(self):
+        processor = PPTXProcessor({})
+        processor.presentation = object()
+        processor.processing_stats['total_slides'] = 3
+        self.assertEqual(list(processor.parse_slide_range(' ALL ')), [0, 1, 2])
+        self.assertEqual(processor.parse_slide_range('3,1'), [0, 2])
+
+
+class TestExtractTextElements(unittest.TestCase):
+    """Extraction of paragraph elements and their way back to the live paragraphs"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.deck = Path(temp_dir.name) / "deck.pptx"
+
+    def load(self, settings=None) -> PPTXProcessor:
+        processor = PPTXProcessor(dict({'cache_translations': False}, **(settings or {})))
+        self.addCleanup(processor.close)
+        processor.load_presentation(str(self.deck))
+        return processor
+
+    def test_elements_resolve_to_their_paragraphs(self):
+        make_deck(self.deck, ['Zeile eins\nZeile zwei', 'Zeile drei', 'Zeile vier\n\nZeile fünf'])
+        for parallel in (False, True):
+            with self.subTest(parallel=parallel):
+                processor = self.load({'parallel_processing': parallel, 'extract_workers': 3})
+                elements = processor.extract_text_elements()
+
+                self.assertEqual([element['original_text'] for element in elements],
+                                 ['Zeile eins', 'Zeile zwei', 'Zeile drei', 'Zeile vier', 'Zeile fünf'])
+                self.assertEqual([element['id'] for element in elements], list(range(5)))
+                for element in elements:
+                    self.assertEqual(processor._resolve_paragraph(element).text, element['original_text'])
+
+
+class TestFormattingExtraction(unittest.TestCase):
+    """Run and paragraph formatting read straight from <a:rPr> and <a:pPr>"""
+
+    def setUp(self):
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        self.text_frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame
+        self.processor = PPTXProcessor({})
+
+    def test_run_formatting(self):
+        from pptx.dml.color import RGBColor
+        from pptx.enum.text import MSO_UNDERLINE
+        from pptx.util import Pt
+
+        paragraph = self.text_frame.paragraphs[0]
+        plain = paragraph.add_run()
+        styled = paragraph.add_run()
+        styled.font.bold = True
+        styled.font.italic = True
+        styled.font.underline = True
+        styled.font.size = Pt(18)
+        styled.font.name = 'Arial'
+        styled.font.color.rgb = RGBColor(0x12, 0x34, 0xAB)
+        wavy = paragraph.add_run()
+        wavy.font.underline = MSO_UNDERLINE.WAVY_LINE
+        wavy.font.bold = False
+
+        self.assertEqual(self.processor._extract_run_formatting(plain),
+                         {'bold': False, 'italic': False, 'underline': False})
+        self.assertEqual(self.processor._extract_run_formatting(styled),
+                         {'bold': True, 'italic': True, 'underline': True, 'font_size': 18.0,
+                          'font_name': 'Arial', 'font_color': (0x12, 0x34, 0xAB)})
+        self.assertEqual(self.processor._extract_run_formatting(wavy),
+                         {'bold': False, 'italic': False, 'underline': MSO_UNDERLINE.WAVY_LINE})
+
+    def test_paragraph_formatting(self):
+        from pptx.enum.text import PP_ALIGN
+        from pptx.util import Pt
+
+        plain = self.text_frame.paragraphs[0]
+        spaced = self.text_frame.add_paragraph()
+        spaced.alignment = PP_ALIGN.CENTER
+        spaced.space_before = Pt(6)
+        spaced.space_after = Pt(12)
+        justified = self.text_frame.add_paragraph()
+        justified.alignment = PP_ALIGN.JUSTIFY
+        justified.space_before = Pt(0)
+
+        self.assertEqual(self.processor._extract_paragraph_formatting(plain), {})
+        self.assertEqual(self.processor._extract_paragraph_formatting(spaced),
+                         {'alignment': 'center', 'space_before': 6.0, 'space_after': 12.0})
+        self.assertEqual(self.processor._extract_paragraph_formatting(justified), {'alignment': 'justify'})
+
+
+class TestTranslateTextElements(unittest.TestCase):
+    """Translation of extracted elements through the batch translator"""
+
+    def test_batches_are_sent_concurrently(self):
+        client = SlowClient()
+        translator = make_translator({'batch_size': 2, 'max_concurrency': 4}, client=client)
+        processor = PPTXProcessor({'cache_translations': False, 'stream_apply': False}, translator=translator)
+        texts = [f'Zeile {i}' for i in range(12)] + ['Zeile 0', 'https://example.com']
+        processor.text_elements = [make_element(i, text) for i, text in enumerate(texts)]
+        progress = []
+
+        processor.translate_text_elements(progress_callback=progress.append)
+
+        self.assertGreater(client.max_in_flight, 1)
+        self.assertEqual(client.requests, 6)  # 12 unique texts in batches of 2
+        self.assertEqual([element['translated_text'] for element in processor.text_elements],
+                         [text.replace('Zeile', 'row') for text in texts])
+        self.assertEqual(sum(progress), len(texts))
+        self.assertEqual(processor.processing_stats['translated_elements'], 13)
+
+    def test_cached_translations_depend_on_output_fingerprint(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        settings = {'cache_translations': True, 'stream_apply': False,
+                    'translation_cache_file': str(Path(temp_dir.name) / "translation_cache")}
+        client = SlowClient(delay=0)
+
+        def run(fingerprint: str) -> None:
+            translator = make_translator(client=client)
+            translator.output_fingerprint = fingerprint
+            processor = PPTXProcessor(settings, translator=translator)
+            self.addCleanup(processor.close)
+            processor.text_elements = [make_element(0, 'Zeile eins')]
+            processor.translate_text_elements()
+            processor.close()
+            self.assertEqual(processor.text_elements[0]['translated_text'], 'row eins')
+
+        run('a')
+        run('a')  # Served from the cache
+        self.assertEqual(client.requests, 1)
+        run('b')  # Different glossary or API version
+        self.assertEqual(client.requests, 2)
+
+
+class TestSavePresentation(unittest.TestCase):
+    """Incremental save that copies unchanged zip entries without recompressing them"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.deck = Path(temp_dir.name) / "deck.pptx"
+
+    def translate_and_save(self, slide_range: str, settings=None) -> Path:
+        processor = PPTXProcessor(dict({'cache_translations': False}, **(settings or {})),
+                                  translator=make_translator(client=SlowClient(delay=0)))
+        self.addCleanup(processor.close)
+        processor.load_presentation(str(self.deck))
+        processor.extract_text_elements(slide_range)
+        processor.translate_text_elements()
+        processor.apply_translations()
+        # The full python-pptx save must not be needed
+        with mock.patch.object(processor.presentation, 'save', side_effect=AssertionError("full save used")):
+            output_path = Path(processor.save_presentation())
+        self.assertIsNone(processor._source_package)
+        return output_path
+
+    def test_slide_subset_round_trip(self):
+        make_deck(self.deck, ['Zeile eins', 'Zeile zwei', 'Zeile drei'])
+
+        output_path = self.translate_and_save('2')
+
+        assert_local_headers_match(self, output_path)
+        self.assertEqual(slide_texts(output_path), [['Zeile eins'], ['row zwei'], ['Zeile drei']])
+
+    def test_entries_with_data_descriptors(self):
+        make_deck(self.deck, ['Zeile eins', 'Zeile zwei'], streamed=True)
+        with zipfile.ZipFile(self.deck) as package:
+            self.assertTrue(all(info.flag_bits & 0x08 for info in package.infolist()))
+
+        output_path = self.translate_and_save('1')
+
+        assert_local_headers_match(self, output_path)
+        with zipfile.ZipFile(output_path) as package, zipfile.ZipFile(self.deck) as original:
+            self.assertEqual(package.namelist(), original.namelist())
+        self.assertEqual(slide_texts(output_path), [['row eins'], ['Zeile zwei']])
+
+    def test_memory_mapped_deck_is_released(self):
+        make_deck(self.deck, ['Zeile eins', 'Zeile zwei'])
+
+        output_path = self.translate_and_save('2', {'max_in_memory_bytes': 0})
+
+        assert_local_headers_match(self, output_path)
+        self.assertEqual(slide_texts(output_path), [['Zeile eins'], ['row zwei']])
+
+
+class TestLoadPresentation(unittest.TestCase):
+    """Keeping the original package for incremental saves"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.deck = Path(temp_dir.name) / "deck.pptx"
+        make_deck(self.deck, ['Zeile eins'])
+        self.processor = PPTXProcessor({'max_in_memory_bytes': 0})
+        self.addCleanup(self.processor.close)
+
+    def test_loading_again_unmaps_previous_deck(self):
+        self.processor.load_presentation(str(self.deck))
+        mapping = self.processor._source_package
+        self.assertFalse(mapping.closed)
+
+        self.processor.load_presentation(str(self.deck))
+
+        self.assertTrue(mapping.closed)
+        self.assertIsNot(self.processor._source_package, mapping)
+
+    def test_failed_load_releases_package(self):
+        broken = self.deck.with_name("broken.pptx")
+        broken.write_bytes(b'not a zip file')
+
+        with self.assertRaises(PPTXProcessingError):
+            self.processor.load_presentation(str(broken))
+
+        self.assertIsNone(self.processor._source_package)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for the persistent translation cache
+"""
+
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from utils.translation_cache import TranslationCache
+
+
+class TestTranslationCache(unittest.TestCase):
+    """Translation cache backed by a temporary shelve file"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)  # Runs after the caches opened by a test are closed
+        self.cache_file = str(Path(temp_dir.name) / "translation_cache")
+
+    def open_cache(self, **kwargs) -> TranslationCache:
+        cache = TranslationCache(self.cache_file, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_get_and_set(self):
+        cache = self.open_cache()
+        self.assertIsNone(cache.get('Hallo', 'de', 'en'))
+
+        cache.set('Hallo', 'de', 'en', 'Hello')
+
+        self.assertEqual(cache.get('Hallo', 'de', 'en'), 'Hello')
+        self.assertIsNone(cache.get('Hallo', 'de', 'fr'))
+
+    def test_persists_across_instances(self):
+        cache = self.open_cache()
+        cache.set('Hallo', 'de', 'en', 'Hello')
+        cache.close()
+
+        self.assertEqual(self.open_cache().get('Hallo', 'de', 'en'), 'Hello')
+
+    def test_fingerprint_separates_entries(self):
+        cache = self.open_cache()
+        cache.set('Standort', 'de', 'en', 'campus', fingerprint='glossary-a')
+
+        self.assertEqual(cache.get('Standort', 'de', 'en', fingerprint='glossary-a'), 'campus')
+        self.assertIsNone(cache.get('Standort', 'de', 'en', fingerprint='glossary-b'))
+        self.assertIsNone(cache.get('Standort', 'de', 'en'))
+
+    def test_memory_keeps_most_recently_used(self):
+        cache = self.open_cache(memory_size=2)
+        cache.set('eins', 'de', 'en', 'one')
+        cache.set('zwei', 'de', 'en', 'two')
+        cache.get('eins', 'de', 'en')  # Now more recent than 'zwei'
+        cache.set('drei', 'de', 'en', 'three')
+
+        self.assertEqual(set(cache._memory), {TranslationCache.make_key('eins', 'de', 'en'),
+                                              TranslationCache.make_key('drei', 'de', 'en')})
+        # Entries dropped from memory are still on disk
+        self.assertEqual(cache.get('zwei', 'de', 'en'), 'two')
+
+    def test_oldest_entries_trimmed_on_open(self):
+        cache = self.open_cache()
+        for i in range(12):
+            cache.set(f'Zeile {i}', 'de', 'en', f'row {i}')
+        cache.close()
+
+        cache = self.open_cache(max_entries=10, memory_size=0)
+
+        self.assertIsNone(cache.get('Zeile 0', 'de', 'en'))
+        self.assertIsNone(cache.get('Zeile 2', 'de', 'en'))
+        self.assertEqual(cache.get('Zeile 3', 'de', 'en'), 'row 3')
+        self.assertEqual(cache.get('Zeile 11', 'de', 'en'), 'row 11')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,296 @@
+"""
+Tests for the translation engine helpers (no Google Cloud access needed)
+"""
+
+import tempfile
+import threading
+import time
+import types
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from core.translator import (PPTransTranslator, TokenBucket, TranslationServiceV3Client, _compile_phrase_pattern,
+                             _first_existing_path, _pack_batches)
+
+
+class FakeClient:
+    """Stand-in for the Cloud Translation client that returns the text unchanged"""
+
+    def translate(self, values, source_language=None, target_language=None):
+        if isinstance(values, str):
+            return {'translatedText': values}
+        return [{'translatedText': value} for value in values]
+
+
+class SlowClient:
+    """Fake client that takes a while per request, records how many requests overlap and 'translates' Zeile -> row"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def translate(self, values, source_language=None, target_language=None):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if isinstance(values, str):
+                return {'translatedText': values.replace('Zeile', 'row')}
+            return [{'translatedText': value.replace('Zeile', 'row')} for value in values]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def make_translator(settings=None, client=None) -> PPTransTranslator:
+    """Create a translator with a fake client instead of a Google Cloud connection"""
+    with mock.patch.object(PPTransTranslator, '_initialize_google_client', return_value=client or FakeClient()):
+        return PPTransTranslator(settings or {})
+
+
+class TestPackBatches(unittest.TestCase):
+    """Grouping texts into API requests"""
+
+    @staticmethod
+    def pack(texts, max_chars, max_items):
+        items = [(text, [i]) for i, text in enumerate(texts)]
+        return [[text for text, _ in batch] for batch in _pack_batches(items, max_chars, max_items)]
+
+    def test_item_limit(self):
+        self.assertEqual(self.pack(['a', 'b', 'c', 'd', 'e'], 100, 2), [['a', 'b'], ['c', 'd'], ['e']])
+
+    def test_character_limit(self):
+        self.assertEqual(self.pack(['aaaa', 'bbb', 'cc', 'd'], 6, 10), [['aaaa'], ['bbb', 'cc', 'd']])
+
+    def test_oversized_text_gets_its_own_batch(self):
+        self.assertEqual(self.pack(['a', 'x' * 20, 'b'], 5, 10), [['a'], ['x' * 20], ['b']])
+
+    def test_keeps_positions(self):
+        items = [('a', [0, 3]), ('b', [1])]
+        self.assertEqual(list(_pack_batches(items, 100, 10)), [items])
+
+    def test_no_items(self):
+        self.assertEqual(list(_pack_batches([], 100, 10)), [])
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Rate limiting with a fake clock that sleep() advances"""
+
+    def setUp(self):
+        self.now = 100.0
+        self.sleeps = []
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        for name, replacement in (('monotonic', lambda: self.now), ('sleep', sleep)):
+            patcher = mock.patch(f'core.translator.time.{name}', side_effect=replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_burst_up_to_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate=10, capacity=20)
+        for _ in range(20):
+            bucket.acquire()
+        self.assertEqual(self.sleeps, [])
+
+    def test_waits_for_refill(self):
+        bucket = TokenBucket(rate=10, capacity=20)
+        bucket.acquire(20)
+
+        bucket.acquire(5)
+
+        self.assertAlmostEqual(sum(self.sleeps), 0.5)
+
+    def test_refill_stops_at_capacity(self):
+        bucket = TokenBucket(rate=10, capacity=20)
+        bucket.acquire(20)
+        self.now += 60
+
+        bucket.acquire(20)
+        bucket.acquire(10)
+
+        self.assertAlmostEqual(sum(self.sleeps), 1.0)
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        bucket = TokenBucket(rate=10, capacity=20)
+        bucket.acquire(15)
+
+        bucket.acquire(50)
+
+        self.assertAlmostEqual(sum(self.sleeps), 1.5)
+
+
+class TestFirstExistingPath(unittest.TestCase):
+    """Lookup of credential and glossary files"""
+
+    def test_finds_files_added_after_a_miss(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            candidates = (Path(temp_dir) / "first.json", Path(temp_dir) / "second.json")
+            self.assertIsNone(_first_existing_path(candidates))
+
+            candidates[1].write_text('{}')
+            self.assertEqual(_first_existing_path(candidates), candidates[1])
+
+            candidates[0].write_text('{}')
+            self.assertEqual(_first_existing_path(candidates), candidates[0])
+
+
+class TestCreateClient(unittest.TestCase):
+    """Choice of the Cloud Translation client, with the google packages replaced by fakes"""
+
+    def setUp(self):
+        self.translate_v2 = types.ModuleType('google.cloud.translate_v2')
+        self.translate_v2.Client = mock.Mock(name='Client')
+        translate_v3 = types.ModuleType('google.cloud.translate_v3')
+        translate_v3.TranslationServiceClient = mock.Mock(name='TranslationServiceClient')
+        cloud = types.ModuleType('google.cloud')
+        cloud.translate_v2 = self.translate_v2
+        cloud.translate_v3 = translate_v3
+        google = types.ModuleType('google')
+        google.cloud = cloud
+        modules = {'google': google, 'google.cloud': cloud,
+                   'google.cloud.translate_v2': self.translate_v2, 'google.cloud.translate_v3': translate_v3}
+        patcher = mock.patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_v3_uses_configured_project(self):
+        translator = make_translator({'project_id': 'my-project'})
+        client = translator._create_client(project_id='key-project')
+        self.assertIsInstance(client, TranslationServiceV3Client)
+        self.assertEqual(client._parent, 'projects/my-project/locations/global')
+
+    def test_v3_without_project_falls_back_to_v2(self):
+        translator = make_translator()
+        with mock.patch.object(translator, '_default_project_id', return_value=None):
+            client = translator._create_client()
+        self.assertIs(client, self.translate_v2.Client.return_value)
+        self.assertEqual(translator.api_version, 'v2')
+
+    def test_v2_when_configured(self):
+        translator = make_translator({'api_version': 'v2'})
+        self.assertIs(translator._create_client(project_id='key-project'), self.translate_v2.Client.return_value)
+
+
+class TestPostprocessTranslation(unittest.TestCase):
+    """Repetition fixes applied to raw API output"""
+
+    def setUp(self):
+        self.translator = make_translator()
+
+    def test_repetition_fixes_apply_in_table_order(self):
+        """Later fixes see the text left by earlier ones"""
+        cases = {
+            'for the location of the location': 'for the campus',
+            'at the location of the location today': 'at the campus today',
+            'the students of the location of the location': 'the students of the campus',
+        }
+        for translated, expected in cases.items():
+            with self.subTest(translated=translated):
+                self.assertEqual(self.translator._postprocess_translation('Standort', translated), expected)
+
+    def test_repetition_fixes_ignore_case(self):
+        self.assertEqual(self.translator._postprocess_translation('am Standort', 'At The Location'), 'at the campus')
+
+    def test_text_without_trigger_is_unchanged(self):
+        self.assertEqual(self.translator._postprocess_translation('Hallo', 'Hello world'), 'Hello world')
+
+
+class TestCompilePhrasePattern(unittest.TestCase):
+    """Trie-built glossary pattern"""
+
+    def test_no_phrases(self):
+        self.assertIsNone(_compile_phrase_pattern({}))
+
+    def test_longest_phrase_wins(self):
+        pattern = _compile_phrase_pattern(['studierende', 'studierenden', 'des standortes', 'standort'])
+        self.assertEqual(pattern.findall('Die Studierenden des Standortes am Standort'),
+                         ['Studierenden', 'des Standortes', 'Standort'])
+
+    def test_shorter_phrase_still_matches_alone(self):
+        pattern = _compile_phrase_pattern(['first semester day', 'first'])
+        self.assertEqual(pattern.findall('first day, First Semester Day'), ['first', 'First Semester Day'])
+
+    def test_special_characters_are_literal(self):
+        pattern = _compile_phrase_pattern(['c++', 'a.b'])
+        self.assertEqual(pattern.findall('C++ and a.b but not axb'), ['C++', 'a.b'])
+
+
+class TestGlossaryFixes(unittest.TestCase):
+    """Glossary substitutions after translation"""
+
+    def test_overlapping_terms_use_the_longest(self):
+        translator = make_translator()
+        translator.glossary_terms = {'studierende': 'students', 'studierenden': 'students'}
+        translator._glossary_pattern = _compile_phrase_pattern(translator.glossary_terms)
+        self.assertEqual(translator._apply_glossary_fixes('Die Studierenden'), 'Die students')
+
+    def test_output_fingerprint_follows_glossary_and_api_version(self):
+        translator = make_translator()
+        fingerprint = translator.output_fingerprint
+        self.assertEqual(make_translator().output_fingerprint, fingerprint)
+        self.assertNotEqual(make_translator({'api_version': 'v2'}).output_fingerprint, fingerprint)
+
+        translator.glossary_terms = dict(translator.glossary_terms, hörsaal='lecture hall')
+        self.assertNotEqual(translator._output_fingerprint(), fingerprint)
+
+
+class TestTranslateTextBatch(unittest.TestCase):
+    """Concurrent batch translation"""
+
+    def test_batches_overlap_and_keep_input_order(self):
+        client = SlowClient()
+        translator = make_translator({'batch_size': 2, 'max_concurrency': 4}, client=client)
+        texts = [f'Zeile {i}' for i in range(16)] + ['Zeile 3']
+        finished = {}
+
+        result = translator.translate_text_batch(texts, batch_callback=finished.update)
+
+        self.assertEqual(result, [text.replace('Zeile', 'row') for text in texts])
+        self.assertGreater(client.max_in_flight, 1)
+        self.assertEqual(client.requests, 8)  # 16 unique texts in batches of 2
+        self.assertEqual(finished, dict(enumerate(result)))
+
+    def test_chunk_size_caps_characters_per_request(self):
+        client = SlowClient(delay=0)
+        translator = make_translator({'chunk_size': 14, 'batch_size': 50}, client=client)
+
+        translator.translate_text_batch([f'Zeile {i}' for i in range(6)])  # 7 characters each
+
+        self.assertEqual(client.requests, 3)
+
+    def test_individual_translation_overlaps_and_keeps_input_order(self):
+        client = SlowClient()
+        translator = make_translator({'use_batching': False, 'max_concurrency': 4}, client=client)
+        texts = [f'Zeile {i}' for i in range(8)]
+
+        result = translator.translate_text_batch(texts)
+
+        self.assertEqual(result, [text.replace('Zeile', 'row') for text in texts])
+        self.assertGreater(client.max_in_flight, 1)
+
+    def test_skipped_and_remembered_items_are_reported(self):
+        translator = make_translator({'batch_size': 2}, client=SlowClient(delay=0))
+        translator.translate_text_batch(['Zeile eins'])
+        finished = []
+
+        result = translator.translate_text_batch(['Zeile eins', '42', 'Zeile zwei'], batch_callback=finished.append)
+
+        self.assertEqual(result, ['row eins', '42', 'row zwei'])
+        self.assertEqual(finished, [{0: 'row eins', 1: '42'}, {2: 'row zwei'}])
+
+
+if __name__ == '__main__':
+    unittest.main()